@@ -1,14 +1,55 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import dataclasses
 import json
 import os
+import tempfile
+from collections import defaultdict
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+if TYPE_CHECKING:
+    from ai_code_reviewer import CodeReviewer
 
-def get_pr_diff() -> str:
+_SEVERITY_EMOJI = {
+    "critical": "🚨",
+    "high": "🔴",
+    "medium": "⚠️",
+    "low": "💡",
+}
+
+_TYPE_EMOJI = {
+    "bug": "🐛",
+    "security": "🔒",
+    "performance": "⚡",
+    "style": "🎨",
+    "maintainability": "🔧",
+    "documentation": "📝",
+}
+
+_MAX_CONCURRENT_WRITES = 5
+
+
+class PRContext(NamedTuple):
+    repo: str
+    token: str
+    pr_number: int
+    pulls_url: str
+    issues_url: str
+
+
+@lru_cache(maxsize=1)
+def _pr_context() -> PRContext:
     event_path = os.environ.get("GITHUB_EVENT_PATH", "")
     if not event_path:
         raise RuntimeError("GITHUB_EVENT_PATH not set")
@@ -21,42 +62,110 @@ def get_pr_diff() -> str:
         raise RuntimeError("Could not determine PR number")
 
     repo = os.environ.get("GITHUB_REPOSITORY", "")
-    token = os.environ.get("GITHUB_TOKEN", "")
+    base = f"https://api.github.com/repos/{repo}"
+
+    return PRContext(
+        repo=repo,
+        token=os.environ.get("GITHUB_TOKEN", ""),
+        pr_number=pr_number,
+        pulls_url=f"{base}/pulls/{pr_number}",
+        issues_url=f"{base}/issues/{pr_number}",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        ),
+    )
+    session.headers.update(_api_headers())
+    return session
 
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3.diff",
+
+def _api_headers() -> dict[str, str]:
+    return {
+        "Authorization": f"token {_pr_context().token}",
+        "Accept": "application/vnd.github.v3+json",
     }
 
-    response = requests.get(
-        f"https://api.github.com/repos/{repo}/pulls/{pr_number}",
-        headers=headers,
+
+def _async_client() -> httpx.AsyncClient:
+    # HTTP/2 multiplexes every write over a single TLS connection.
+    return httpx.AsyncClient(
+        http2=True,
+        headers=_api_headers(),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
     )
-    response.raise_for_status()
 
-    return response.text
+
+def _existing_files(paths: list[str]) -> list[str]:
+    by_dir: dict[str, list[str]] = defaultdict(list)
+    for path in paths:
+        by_dir[os.path.dirname(path) or "."].append(path)
+
+    present: set[str] = set()
+    for directory, members in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        present.update(p for p in members if os.path.basename(p) in names)
+
+    return [p for p in paths if p in present]
 
 
-def post_review_comment(
+def _diff_cache_paths() -> tuple[Path, Path]:
+    ctx = _pr_context()
+    cache_dir = Path(os.environ.get("RUNNER_TEMP") or tempfile.gettempdir())
+    stem = f"ai-review-{ctx.repo.replace('/', '-')}-{ctx.pr_number}"
+    return cache_dir / f"{stem}.etag", cache_dir / f"{stem}.diff"
+
+
+def get_pr_diff() -> str:
+    etag_path, diff_path = _diff_cache_paths()
+
+    headers = {"Accept": "application/vnd.github.v3.diff"}
+    if etag_path.exists() and diff_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    with _get_session().get(
+        _pr_context().pulls_url,
+        headers=headers,
+        stream=True,
+    ) as response:
+        if response.status_code == 304:
+            return diff_path.read_text(encoding="utf-8")
+
+        response.raise_for_status()
+        # Decode once instead of letting .text sniff the charset of a large body.
+        diff = response.content.decode("utf-8", "replace")
+        etag = response.headers.get("ETag")
+
+    if etag:
+        diff_path.write_text(diff, encoding="utf-8")
+        etag_path.write_text(etag)
+
+    return diff
+
+
+async def post_review_comment(
+    client: httpx.AsyncClient,
     file_path: str,
     line: int,
     body: str,
     commit_sha: str,
 ) -> None:
-    repo = os.environ.get("GITHUB_REPOSITORY", "")
-    token = os.environ.get("GITHUB_TOKEN", "")
-
-    event_path = os.environ.get("GITHUB_EVENT_PATH", "")
-    with open(event_path) as f:
-        event = json.load(f)
-
-    pr_number = event.get("pull_request", {}).get("number")
-
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-
     data = {
         "body": body,
         "commit_id": commit_sha,
@@ -65,9 +174,8 @@ def post_review_comment(
         "side": "RIGHT",
     }
 
-    response = requests.post(
-        f"https://api.github.com/repos/{repo}/pulls/{pr_number}/comments",
-        headers=headers,
+    response = await client.post(
+        f"{_pr_context().pulls_url}/comments",
         json=data,
     )
 
@@ -75,26 +183,11 @@ def post_review_comment(
         print(f"Warning: Failed to post comment: {response.text}")
 
 
-def post_summary_comment(summary: str) -> None:
-    repo = os.environ.get("GITHUB_REPOSITORY", "")
-    token = os.environ.get("GITHUB_TOKEN", "")
-
-    event_path = os.environ.get("GITHUB_EVENT_PATH", "")
-    with open(event_path) as f:
-        event = json.load(f)
-
-    pr_number = event.get("pull_request", {}).get("number")
-
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-
+async def post_summary_comment(client: httpx.AsyncClient, summary: str) -> None:
     data = {"body": summary}
 
-    response = requests.post(
-        f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments",
-        headers=headers,
+    response = await client.post(
+        f"{_pr_context().issues_url}/comments",
         json=data,
     )
 
@@ -102,24 +195,9 @@ def post_summary_comment(summary: str) -> None:
         print(f"Warning: Failed to post summary: {response.text}")
 
 
-def add_labels(labels: list[str]) -> None:
-    repo = os.environ.get("GITHUB_REPOSITORY", "")
-    token = os.environ.get("GITHUB_TOKEN", "")
-
-    event_path = os.environ.get("GITHUB_EVENT_PATH", "")
-    with open(event_path) as f:
-        event = json.load(f)
-
-    pr_number = event.get("pull_request", {}).get("number")
-
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-
-    response = requests.post(
-        f"https://api.github.com/repos/{repo}/issues/{pr_number}/labels",
-        headers=headers,
+async def add_labels(client: httpx.AsyncClient, labels: list[str]) -> None:
+    response = await client.post(
+        f"{_pr_context().issues_url}/labels",
         json={"labels": labels},
     )
 
@@ -127,77 +205,130 @@ def add_labels(labels: list[str]) -> None:
         print(f"Warning: Failed to add labels: {response.text}")
 
 
-def format_issue_comment(issue: dict) -> str:
-    severity_emoji = {
-        "critical": "🚨",
-        "high": "🔴",
-        "medium": "⚠️",
-        "low": "💡",
-    }
+def _review_one(
+    reviewer: CodeReviewer,
+    file_path: str,
+    commit_sha: str,
+) -> tuple[dict, list[tuple[str, int, str, str]]] | None:
+    print(f"Reviewing: {file_path}")
 
-    type_emoji = {
-        "bug": "🐛",
-        "security": "🔒",
-        "performance": "⚡",
-        "style": "🎨",
-        "maintainability": "🔧",
-        "documentation": "📝",
-    }
+    try:
+        result = reviewer.review_file(file_path)
+        result_dict = result.to_dict()
+        result_dict["file_path"] = file_path
+
+        comments = [
+            (file_path, issue.line, format_issue_comment(issue.to_dict()), commit_sha)
+            for issue in result.filter_by_severity(reviewer.config.severity_threshold)
+        ]
+    except Exception as e:
+        print(f"Error reviewing {file_path}: {e}")
+        return None
+
+    return result_dict, comments
+
+
+async def _publish(
+    comments: list[tuple[str, int, str, str]],
+    summary: str,
+    labels: list[str],
+) -> None:
+    # HTTP/2 streams share one connection, so connection limits don't bound
+    # concurrent writes; keep them small to stay under GitHub's secondary rate limits.
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+    async def limited(request: Awaitable[None]) -> None:
+        async with semaphore:
+            await request
+
+    async with _async_client() as client:
+        outcomes = await asyncio.gather(
+            *(limited(post_review_comment(client, *comment)) for comment in comments),
+            limited(post_summary_comment(client, summary)),
+            limited(add_labels(client, labels)),
+            return_exceptions=True,
+        )
 
-    emoji = severity_emoji.get(issue["severity"], "📌")
-    type_em = type_emoji.get(issue["type"], "")
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            print(f"Warning: GitHub request failed: {outcome}")
+
+
+def format_issue_comment(issue: dict) -> str:
+    emoji = _SEVERITY_EMOJI.get(issue["severity"], "📌")
+    type_em = _TYPE_EMOJI.get(issue["type"], "")
 
-    comment = f"**{emoji} {type_em} {issue['type'].title()}** ({issue['severity']})\n\n"
-    comment += f"{issue['message']}\n"
+    parts = [
+        f"**{emoji} {type_em} {issue['type'].title()}** ({issue['severity']})\n\n",
+        f"{issue['message']}\n",
+    ]
 
     if issue.get("suggestion"):
-        comment += f"\n💡 **Suggestion:** {issue['suggestion']}\n"
+        parts.append(f"\n💡 **Suggestion:** {issue['suggestion']}\n")
 
     if issue.get("code_suggestion"):
-        comment += f"\n```suggestion\n{issue['code_suggestion']}\n```\n"
+        parts.append(f"\n```suggestion\n{issue['code_suggestion']}\n```\n")
 
-    return comment
+    return "".join(parts)
 
 
-def format_summary(results: list[dict], include_positive: bool) -> str:
-    total_issues = sum(len(r["issues"]) for r in results)
-    total_bugs = sum(r["summary"]["bugs"] for r in results)
-    total_security = sum(r["summary"]["security_issues"] for r in results)
-    avg_score = sum(r["summary"]["quality_score"] for r in results) / len(results) if results else 0
+def aggregate_results(results: list[dict]) -> dict:
+    totals = {"issues": 0, "bugs": 0, "security": 0, "score": 0.0}
+    for r in results:
+        summary = r["summary"]
+        totals["issues"] += len(r["issues"])
+        totals["bugs"] += summary["bugs"]
+        totals["security"] += summary["security_issues"]
+        totals["score"] += summary["quality_score"]
+    return totals
 
-    summary = "## 🔍 AI Code Review Summary\n\n"
+
+def format_summary(
+    results: list[dict],
+    include_positive: bool,
+    totals: dict | None = None,
+) -> str:
+    if totals is None:
+        totals = aggregate_results(results)
+
+    total_issues = totals["issues"]
+    total_bugs = totals["bugs"]
+    total_security = totals["security"]
+    avg_score = totals["score"] / len(results) if results else 0
+
+    parts = ["## 🔍 AI Code Review Summary\n\n"]
 
     if total_issues == 0:
-        summary += "✅ **No issues found!** Great code!\n\n"
+        parts.append("✅ **No issues found!** Great code!\n\n")
     else:
-        summary += f"Found **{total_issues}** issues across **{len(results)}** files.\n\n"
+        parts.append(f"Found **{total_issues}** issues across **{len(results)}** files.\n\n")
 
-    summary += "| Metric | Value |\n"
-    summary += "|--------|-------|\n"
-    summary += f"| 🐛 Bugs | {total_bugs} |\n"
-    summary += f"| 🔒 Security Issues | {total_security} |\n"
-    summary += f"| 📊 Quality Score | {avg_score:.1f}/10 |\n"
-    summary += f"| 📁 Files Reviewed | {len(results)} |\n\n"
+    parts.append("| Metric | Value |\n")
+    parts.append("|--------|-------|\n")
+    parts.append(f"| 🐛 Bugs | {total_bugs} |\n")
+    parts.append(f"| 🔒 Security Issues | {total_security} |\n")
+    parts.append(f"| 📊 Quality Score | {avg_score:.1f}/10 |\n")
+    parts.append(f"| 📁 Files Reviewed | {len(results)} |\n\n")
 
     if results:
-        summary += "### Files Reviewed\n\n"
-        for r in results:
-            file_emoji = "✅" if not r["issues"] else "⚠️"
-            summary += f"- {file_emoji} `{r['file_path']}` - {len(r['issues'])} issues (Score: {r['summary']['quality_score']}/10)\n"
-
-    if include_positive:
-        all_positive = []
-        for r in results:
+        parts.append("### Files Reviewed\n\n")
+
+    all_positive = []
+    for r in results:
+        issue_count = len(r["issues"])
+        file_emoji = "✅" if not issue_count else "⚠️"
+        parts.append(f"- {file_emoji} `{r['file_path']}` - {issue_count} issues (Score: {r['summary']['quality_score']}/10)\n")
+        if include_positive:
             all_positive.extend(r.get("positive_feedback", []))
 
-        if all_positive:
-            summary += "\n### ✨ Positive Observations\n\n"
-            for fb in all_positive[:5]:  # Limit to 5
-                summary += f"- {fb}\n"
+    if all_positive:
+        parts.append("\n### ✨ Positive Observations\n\n")
+        for fb in all_positive[:5]:  # Limit to 5
+            parts.append(f"- {fb}\n")
 
-    summary += "\n---\n*Reviewed by [AI Code Reviewer](https://github.com/techn4r/ai-code-reviewer)*"
+    parts.append("\n---\n*Reviewed by [AI Code Reviewer](https://github.com/techn4r/ai-code-reviewer)*")
 
-    return summary
+    return "".join(parts)
 
 
 def main():
@@ -230,65 +361,65 @@ def main():
     else:
         config = ReviewConfig()
 
-    config.provider = LLMProvider(args.provider)
-    config.model = args.model
-    config.severity_threshold = Severity(args.severity)
-    config.max_issues = args.max_comments
+    config = dataclasses.replace(
+        config,
+        provider=LLMProvider(args.provider),
+        model=args.model,
+        severity_threshold=Severity(args.severity),
+        max_issues=args.max_comments,
+    )
 
     reviewer = CodeReviewer(config)
 
     sha = os.environ.get("GITHUB_SHA", "")
 
+    files = _existing_files(changed_files)
     results = []
-    comments_posted = 0
-
-    for file_path in changed_files:
-        if not Path(file_path).exists():
-            continue
-
-        print(f"Reviewing: {file_path}")
-
-        try:
-            result = reviewer.review_file(file_path)
-            result_dict = result.to_dict()
-            result_dict["file_path"] = file_path
+    pending_comments: list[tuple[str, int, str, str]] = []
+
+    if files:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            outcomes = list(executor.map(
+                lambda file_path: _review_one(reviewer, file_path, sha),
+                files,
+            ))
+
+        # map() keeps PR order, so the summary and the comment cap are stable.
+        for outcome in outcomes:
+            if outcome is None:
+                continue
+            result_dict, comments = outcome
             results.append(result_dict)
+            remaining = max(0, args.max_comments - len(pending_comments))
+            pending_comments.extend(comments[:remaining])
 
-            for issue in result.filter_by_severity(config.severity_threshold):
-                if comments_posted >= args.max_comments:
-                    break
-
-                comment = format_issue_comment(issue.to_dict())
-                post_review_comment(file_path, issue.line, comment, sha)
-                comments_posted += 1
-
-        except Exception as e:
-            print(f"Error reviewing {file_path}: {e}")
+    totals = aggregate_results(results)
+    total_issues = totals["issues"]
 
     include_positive = args.include_positive.lower() == "true"
-    summary = format_summary(results, include_positive)
-    post_summary_comment(summary)
+    summary = format_summary(results, include_positive, totals)
 
     labels = []
-    total_issues = sum(len(r["issues"]) for r in results)
 
     if total_issues == 0:
         labels.append("ai-review:clean")
-    elif any(r["summary"]["security_issues"] > 0 for r in results):
+    elif totals["security"] > 0:
         labels.append("ai-review:security")
-    elif any(r["summary"]["bugs"] > 0 for r in results):
+    elif totals["bugs"] > 0:
         labels.append("ai-review:bugs")
     else:
         labels.append("ai-review:suggestions")
 
-    add_labels(labels)
+    asyncio.run(_publish(pending_comments, summary, labels))
 
-    avg_score = sum(r["summary"]["quality_score"] for r in results) / len(results) if results else 10
+    avg_score = totals["score"] / len(results) if results else 10
 
     with open(os.environ.get("GITHUB_OUTPUT", "/dev/null"), "a") as f:
-        f.write(f"issues-found={total_issues}\n")
-        f.write(f"quality-score={avg_score:.1f}\n")
-        f.write(f"review-summary=Reviewed {len(results)} files, found {total_issues} issues\n")
+        f.write(
+            f"issues-found={total_issues}\n"
+            f"quality-score={avg_score:.1f}\n"
+            f"review-summary=Reviewed {len(results)} files, found {total_issues} issues\n"
+        )
 
     print(f"\n✅ Review complete! Found {total_issues} issues across {len(results)} files.")
     print(f"📊 Average quality score: {avg_score:.1f}/10")
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from ai_code_reviewer import CodeReviewer, __version__
+from ai_code_reviewer.analyzer import ReviewMode
+
+if TYPE_CHECKING:
+    from ai_code_reviewer.models import ReviewResult
 
 reviewer_instance = None
 
@@ -41,6 +50,13 @@ class IssueResponse(BaseModel):
     suggestion: str | None = None
     code_suggestion: str | None = None
 
+    model_config = {"from_attributes": True}
+
+    @field_validator("type", "severity", mode="before")
+    @classmethod
+    def _enum_value(cls, value: Any) -> Any:
+        return value.value if isinstance(value, Enum) else value
+
 
 class SummaryResponse(BaseModel):
     total_issues: int
@@ -50,6 +66,8 @@ class SummaryResponse(BaseModel):
     style_issues: int
     quality_score: float
 
+    model_config = {"from_attributes": True}
+
 
 class ReviewResponse(BaseModel):
     status: str = "success"
@@ -58,6 +76,8 @@ class ReviewResponse(BaseModel):
     positive_feedback: list[str]
     file_path: str | None = None
 
+    model_config = {"from_attributes": True}
+
 
 class HealthResponse(BaseModel):
     status: str
@@ -66,10 +86,16 @@ class HealthResponse(BaseModel):
     provider: str
 
 
+_RESPONSE_LIST = TypeAdapter(list[ReviewResponse])
+
+
+def _to_response(result: ReviewResult) -> ReviewResponse:
+    return ReviewResponse.model_validate(result)
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     global reviewer_instance
-    from ai_code_reviewer import CodeReviewer
     reviewer_instance = CodeReviewer()
     yield
     reviewer_instance = None
@@ -80,6 +106,7 @@ app = FastAPI(
     description="Intelligent code review powered by LLMs",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -105,8 +132,6 @@ async def root():
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
-    from ai_code_reviewer import __version__
-
     return HealthResponse(
         status="healthy",
         version=__version__,
@@ -121,41 +146,14 @@ async def review_code(request: ReviewRequest):
         raise HTTPException(status_code=503, detail="Reviewer not initialized")
 
     try:
-        from ai_code_reviewer.analyzer import ReviewMode
-
-        if request.mode:
-            reviewer_instance.config.mode = ReviewMode(request.mode)
-
         result = reviewer_instance.review(
             code=request.code,
             language=request.language,
             context=request.context,
+            mode=ReviewMode(request.mode) if request.mode else None,
         )
 
-        return ReviewResponse(
-            status="success",
-            issues=[
-                IssueResponse(
-                    type=issue.type.value,
-                    severity=issue.severity.value,
-                    line=issue.line,
-                    end_line=issue.end_line,
-                    message=issue.message,
-                    suggestion=issue.suggestion,
-                    code_suggestion=issue.code_suggestion,
-                )
-                for issue in result.issues
-            ],
-            summary=SummaryResponse(
-                total_issues=result.summary.total_issues,
-                bugs=result.summary.bugs,
-                security_issues=result.summary.security_issues,
-                performance_issues=result.summary.performance_issues,
-                style_issues=result.summary.style_issues,
-                quality_score=result.summary.quality_score,
-            ),
-            positive_feedback=result.positive_feedback,
-        )
+        return _to_response(result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -171,39 +169,12 @@ async def review_diff(request: DiffReviewRequest):
         if request.base_content and request.file_path:
             base_content = {request.file_path: request.base_content}
 
-        results = reviewer_instance.review_diff(
+        results = await reviewer_instance.areview_diff(
             diff=request.diff,
             base_content=base_content,
         )
 
-        return [
-            ReviewResponse(
-                status="success",
-                issues=[
-                    IssueResponse(
-                        type=issue.type.value,
-                        severity=issue.severity.value,
-                        line=issue.line,
-                        end_line=issue.end_line,
-                        message=issue.message,
-                        suggestion=issue.suggestion,
-                        code_suggestion=issue.code_suggestion,
-                    )
-                    for issue in result.issues
-                ],
-                summary=SummaryResponse(
-                    total_issues=result.summary.total_issues,
-                    bugs=result.summary.bugs,
-                    security_issues=result.summary.security_issues,
-                    performance_issues=result.summary.performance_issues,
-                    style_issues=result.summary.style_issues,
-                    quality_score=result.summary.quality_score,
-                ),
-                positive_feedback=result.positive_feedback,
-                file_path=result.file_path,
-            )
-            for result in results
-        ]
+        return _RESPONSE_LIST.validate_python(results)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -226,31 +197,7 @@ async def review_file_content(
         )
         result.file_path = file_path
 
-        return ReviewResponse(
-            status="success",
-            issues=[
-                IssueResponse(
-                    type=issue.type.value,
-                    severity=issue.severity.value,
-                    line=issue.line,
-                    end_line=issue.end_line,
-                    message=issue.message,
-                    suggestion=issue.suggestion,
-                    code_suggestion=issue.code_suggestion,
-                )
-                for issue in result.issues
-            ],
-            summary=SummaryResponse(
-                total_issues=result.summary.total_issues,
-                bugs=result.summary.bugs,
-                security_issues=result.summary.security_issues,
-                performance_issues=result.summary.performance_issues,
-                style_issues=result.summary.style_issues,
-                quality_score=result.summary.quality_score,
-            ),
-            positive_feedback=result.positive_feedback,
-            file_path=result.file_path,
-        )
+        return _to_response(result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
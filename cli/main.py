@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
@@ -9,27 +11,41 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+
 console = Console()
 
+_SEVERITY_COLORS = {
+    "low": "blue",
+    "medium": "yellow",
+    "high": "red",
+    "critical": "bold red on white",
+}
 
-def print_banner():
-    banner = """
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════╗
 ║                  🔍 AI Code Reviewer                       ║
 ║           Intelligent code review powered by LLMs          ║
 ╚═══════════════════════════════════════════════════════════╝
     """
-    console.print(banner, style="bold blue")
+
+_SEPARATOR = "─" * 60
+
+
+def print_banner():
+    console.print(_BANNER, style="bold blue")
+
+
+@lru_cache(maxsize=1)
+def _python_lexer() -> Lexer:
+    from pygments.lexers import get_lexer_by_name
+
+    return get_lexer_by_name("python")
 
 
 def format_severity_badge(severity: str) -> str:
-    colors = {
-        "low": "blue",
-        "medium": "yellow",
-        "high": "red",
-        "critical": "bold red on white",
-    }
-    return f"[{colors.get(severity, 'white')}]{severity.upper()}[/]"
+    return f"[{_SEVERITY_COLORS.get(severity, 'white')}]{severity.upper()}[/]"
 
 
 def print_issue(issue: dict, show_code: bool = True):
@@ -55,7 +71,7 @@ def print_issue(issue: dict, show_code: bool = True):
         console.print()
         syntax = Syntax(
             code_suggestion,
-            "python",
+            _python_lexer(),
             theme="monokai",
             line_numbers=False,
             padding=1,
@@ -130,7 +146,7 @@ def review(file_path: str, model: str, provider: str, mode: str, output: str, no
             model=model,
             mode=ReviewMode(mode),
         )
-        reviewer = CodeReviewer(config)
+        reviewer = CodeReviewer(config, cache=True)
 
         try:
             result = reviewer.review_file(file_path)
@@ -144,7 +160,7 @@ def review(file_path: str, model: str, provider: str, mode: str, output: str, no
     else:
         if result.issues:
             console.print(f"Found [bold]{len(result.issues)}[/] issues:\n")
-            console.print("─" * 60)
+            console.print(_SEPARATOR)
             for issue in result.issues:
                 print_issue(issue.to_dict())
         else:
@@ -171,7 +187,7 @@ def staged(model: str, provider: str, repo: str):
             provider=LLMProvider(provider),
             model=model,
         )
-        reviewer = CodeReviewer(config)
+        reviewer = CodeReviewer(config, cache=True)
 
         try:
             results = reviewer.review_staged(repo)
@@ -188,7 +204,7 @@ def staged(model: str, provider: str, repo: str):
 
     for result in results:
         console.print(f"\n📄 [bold]{result.file_path}[/]")
-        console.print("─" * 60)
+        console.print(_SEPARATOR)
 
         if result.issues:
             for issue in result.issues:
@@ -215,7 +231,7 @@ def diff(diff_file: str, model: str, provider: str):
             provider=LLMProvider(provider),
             model=model,
         )
-        reviewer = CodeReviewer(config)
+        reviewer = CodeReviewer(config, cache=True)
 
         diff_content = Path(diff_file).read_text()
 
@@ -227,7 +243,7 @@ def diff(diff_file: str, model: str, provider: str):
 
     for result in results:
         console.print(f"\n📄 [bold]{result.file_path}[/]")
-        console.print("─" * 60)
+        console.print(_SEPARATOR)
 
         if result.issues:
             for issue in result.issues:
@@ -1,6 +1,13 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator
 
 import streamlit as st
 
+from ai_code_reviewer.analyzer import CodeReviewer, ReviewConfig, ReviewMode
+from ai_code_reviewer.models import LLMProvider
+
 st.set_page_config(
     page_title="AI Code Reviewer",
     page_icon="🔍",
@@ -36,17 +43,29 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+EMOJI_MAP = {
+    "bug": "🐛",
+    "security": "🔒",
+    "performance": "⚡",
+    "style": "🎨",
+    "maintainability": "🔧",
+    "documentation": "📝",
+    "best_practice": "✨",
+    "type_error": "🔤",
+}
+
+_STAT_KEYS = ("reviews_count", "issues_found")
+
+_SCORE_THRESHOLDS = (4, 7)
+_SCORE_CLASSES = ("score-bad", "score-medium", "score-good")
+
 
 def get_severity_class(severity: str) -> str:
     return f"severity-{severity}"
 
 
 def get_score_class(score: float) -> str:
-    if score >= 7:
-        return "score-good"
-    elif score >= 4:
-        return "score-medium"
-    return "score-bad"
+    return _SCORE_CLASSES[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def format_issue_card(issue: dict) -> str:
@@ -56,32 +75,42 @@ def format_issue_card(issue: dict) -> str:
     message = issue.get("message", "")
     suggestion = issue.get("suggestion", "")
 
-    emoji_map = {
-        "bug": "🐛",
-        "security": "🔒",
-        "performance": "⚡",
-        "style": "🎨",
-        "maintainability": "🔧",
-        "documentation": "📝",
-        "best_practice": "✨",
-        "type_error": "🔤",
-    }
-
-    emoji = emoji_map.get(issue_type, "📌")
+    emoji = EMOJI_MAP.get(issue_type, "📌")
+    suggestion_html = f'<p style="color: #059669;">💡 {suggestion}</p>' if suggestion else ""
 
-    html = f"""
+    return f"""
     <div class="issue-card {get_severity_class(severity)}">
         <strong>{emoji} {issue_type.upper()}</strong>
         <span style="color: #6b7280;">Line {line}</span>
         <br>
         <p>{message}</p>
-    """
+    {suggestion_html}</div>"""
 
-    if suggestion:
-        html += f'<p style="color: #059669;">💡 {suggestion}</p>'
 
-    html += "</div>"
-    return html
+@st.cache_resource
+def get_reviewer(provider: str, model: str, api_key: str) -> CodeReviewer:
+    return CodeReviewer(
+        ReviewConfig(provider=LLMProvider(provider), model=model),
+        api_key=api_key or None,
+        cache=True,
+    )
+
+
+def stream_review(
+    code: str,
+    language: str,
+    context: str | None,
+    mode: str,
+    model: str,
+    provider: str,
+) -> Iterator[str]:
+    reviewer = get_reviewer(provider, model, st.session_state.get("api_key", ""))
+    return reviewer.review_stream(code, language, context, mode=ReviewMode(mode))
+
+
+def result_from_stream(text: str, code: str, language: str, model: str, provider: str) -> dict:
+    reviewer = get_reviewer(provider, model, st.session_state.get("api_key", ""))
+    return reviewer.result_from_stream(text, code, language).to_dict()
 
 
 def main():
@@ -106,12 +135,12 @@ def main():
             "local": ["llama3", "codellama", "mistral"],
         }
 
-        st.selectbox(
+        model = st.selectbox(
             "Model",
             model_options.get(provider, ["default"]),
         )
 
-        st.selectbox(
+        mode = st.selectbox(
             "Review Mode",
             ["quick", "standard", "deep"],
             index=1,
@@ -123,12 +152,17 @@ def main():
         st.text_input(
             "API Key",
             type="password",
+            key="api_key",
             help="Your API key (or set via environment variable)"
         )
 
         st.divider()
 
         st.markdown("### 📊 Statistics")
+        if st.button("Reset statistics"):
+            for key in _STAT_KEYS:
+                st.session_state.pop(key, None)
+
         if "reviews_count" not in st.session_state:
             st.session_state.reviews_count = 0
             st.session_state.issues_found = 0
@@ -145,7 +179,7 @@ def main():
         with col1:
             st.subheader("Your Code")
 
-            st.selectbox(
+            language = st.selectbox(
                 "Language",
                 ["python", "javascript", "typescript", "java", "go", "rust", "cpp", "c"],
             )
@@ -156,7 +190,7 @@ def main():
                 placeholder="def calculate_average(numbers):\n    total = 0\n    for n in numbers:\n        total += n\n    return total / len(numbers)",
             )
 
-            st.text_input(
+            context = st.text_input(
                 "Additional context (optional)",
                 placeholder="This function calculates the average of a list of numbers"
             )
@@ -167,71 +201,44 @@ def main():
             st.subheader("Review Results")
 
             if review_button and code:
-                with st.spinner("Analyzing code..."):
-                    try:
-                        result = {
-                            "issues": [
-                                {
-                                    "type": "bug",
-                                    "severity": "high",
-                                    "line": 5,
-                                    "message": "Potential ZeroDivisionError if 'numbers' is empty",
-                                    "suggestion": "Add a check for empty list before division"
-                                },
-                                {
-                                    "type": "performance",
-                                    "severity": "low",
-                                    "line": 2,
-                                    "message": "Manual sum calculation can be simplified",
-                                    "suggestion": "Use built-in sum() function"
-                                }
-                            ],
-                            "positive_feedback": [
-                                "Clear function name",
-                                "Simple and readable logic"
-                            ],
-                            "summary": {
-                                "total_issues": 2,
-                                "bugs": 1,
-                                "security_issues": 0,
-                                "performance_issues": 1,
-                                "style_issues": 0,
-                                "quality_score": 7.0
-                            }
-                        }
-
-
-                        st.session_state.reviews_count += 1
-                        st.session_state.issues_found += len(result["issues"])
-
-                        score = result["summary"]["quality_score"]
-                        st.markdown(
-                            f'<p class="quality-score {get_score_class(score)}">{score}/10</p>',
-                            unsafe_allow_html=True
-                        )
-                        st.caption("Quality Score")
-
-                        if result["issues"]:
-                            st.markdown("### Issues Found")
-                            for issue in result["issues"]:
-                                st.markdown(format_issue_card(issue), unsafe_allow_html=True)
-                        else:
-                            st.success("✅ No issues found! Great code!")
-
-                        if result["positive_feedback"]:
-                            st.markdown("### ✨ Positive Feedback")
-                            for fb in result["positive_feedback"]:
-                                st.markdown(f"• {fb}")
-
-                        st.markdown("### Summary")
-                        cols = st.columns(4)
-                        cols[0].metric("🐛 Bugs", result["summary"]["bugs"])
-                        cols[1].metric("🔒 Security", result["summary"]["security_issues"])
-                        cols[2].metric("⚡ Performance", result["summary"]["performance_issues"])
-                        cols[3].metric("🎨 Style", result["summary"]["style_issues"])
-
-                    except Exception as e:
-                        st.error(f"Error during review: {str(e)}")
+                live = st.empty()
+                try:
+                    # Repeat reviews of the same code are replayed from the reviewer's response cache.
+                    text = live.write_stream(stream_review(code, language, context or None, mode, model, provider))
+                    result = result_from_stream(text, code, language, model, provider)
+                    live.empty()
+
+                    st.session_state.reviews_count += 1
+                    st.session_state.issues_found += len(result["issues"])
+
+                    score = result["summary"]["quality_score"]
+                    st.markdown(
+                        f'<p class="quality-score {get_score_class(score)}">{score}/10</p>',
+                        unsafe_allow_html=True
+                    )
+                    st.caption("Quality Score")
+
+                    if result["issues"]:
+                        st.markdown("### Issues Found")
+                        for issue in result["issues"]:
+                            st.markdown(format_issue_card(issue), unsafe_allow_html=True)
+                    else:
+                        st.success("✅ No issues found! Great code!")
+
+                    if result["positive_feedback"]:
+                        st.markdown("### ✨ Positive Feedback")
+                        for fb in result["positive_feedback"]:
+                            st.markdown(f"• {fb}")
+
+                    st.markdown("### Summary")
+                    cols = st.columns(4)
+                    cols[0].metric("🐛 Bugs", result["summary"]["bugs"])
+                    cols[1].metric("🔒 Security", result["summary"]["security_issues"])
+                    cols[2].metric("⚡ Performance", result["summary"]["performance_issues"])
+                    cols[3].metric("🎨 Style", result["summary"]["style_issues"])
+
+                except Exception as e:
+                    st.error(f"Error during review: {str(e)}")
 
             elif review_button:
                 st.warning("Please enter some code to review.")
@@ -180,7 +180,7 @@ def example_api_integration():
         print(f"Error: {response.text}")
 
 def example_batch_review():
-    from concurrent.futures import ThreadPoolExecutor
+    import asyncio
     from pathlib import Path
 
     from ai_code_reviewer import CodeReviewer
@@ -189,16 +189,10 @@ def example_batch_review():
 
     files = list(Path("src").rglob("*.py"))
 
-    def review_file(file_path):
-        try:
-            return str(file_path), reviewer.review_file(file_path)
-        except Exception:
-            return str(file_path), None
-
-    results = {}
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        for path, result in executor.map(review_file, files):
-            results[path] = result
+    # One async client, at most config.max_concurrency requests in flight;
+    # files that fail to read or review come back as None.
+    reviewed = asyncio.run(reviewer.areview_files(files))
+    results = {str(path): result for path, result in zip(files, reviewed)}
 
     total_files = len(results)
     total_issues = sum(
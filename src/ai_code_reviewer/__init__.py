@@ -1,5 +1,32 @@
-from .analyzer import CodeReviewer
-from .models.reviewer_model import Issue, ReviewResult, Severity
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analyzer import CodeReviewer
+    from .models.reviewer_model import Issue, ReviewResult, Severity
 
 __version__ = "1.0.0"
 __all__ = ["CodeReviewer", "ReviewResult", "Issue", "Severity"]
+
+_LAZY_IMPORTS = {
+    "CodeReviewer": ".analyzer",
+    "ReviewResult": ".models.reviewer_model",
+    "Issue": ".models.reviewer_model",
+    "Severity": ".models.reviewer_model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 the classes keep a __dict__.
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,21 +1,109 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import threading
+from collections.abc import Coroutine, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 from .models.reviewer_model import (
+    Issue,
     LLMProvider,
     ReviewResult,
     ReviewSummary,
     Severity,
 )
-from .parsers.diff_parser import DiffParser
+from .parsers.diff_parser import DiffParser, FileDiff
 from .prompts.templates import PromptBuilder
+from .static_analyzer import FastAnalyzer
+from .utils.cache import ResponseCache, make_cache_key
 from .utils.code_utils import detect_language, extract_code_context
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+_T = TypeVar("_T")
+
+
+def _extract_json(text: str) -> dict[str, Any] | None:
+    # raw_decode stops at the matching close brace, so surrounding prose and
+    # fences (even ones nested inside JSON strings) never need a regex pass.
+    fence = text.find("```json")
+    start = text.find("{", fence + 7 if fence != -1 else 0)
+    if start == -1:
+        return None
+
+    if _HAS_ORJSON:
+        # Usually the object runs to the last brace; only fall back to the
+        # incremental decoder when there is trailing text that is not JSON.
+        try:
+            data = orjson.loads(text[start:text.rfind("}") + 1])
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            return data if isinstance(data, dict) else None
+
+    try:
+        data, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def _run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # asyncio.run() refuses to nest inside a running loop (Jupyter, async
+    # web handlers), so give the coroutine a loop of its own on a worker thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _cacheable(response: str | None) -> bool:
+    # Truncated or malformed replies would otherwise be replayed until they expire.
+    return response is not None and _extract_json(response) is not None
+
+
+def _batch_entries(response: str) -> dict[str, dict[str, Any]]:
+    data = _extract_json(response)
+    files = data.get("files") if data else None
+    if not isinstance(files, list):
+        return {}
+
+    return {
+        entry["file"]: entry
+        for entry in files
+        if isinstance(entry, dict) and isinstance(entry.get("file"), str)
+    }
+
+
+_NO_RULES: Mapping[str, Any] = MappingProxyType({})
+
+# Rough prompt sizes (about 4 characters per token) for packing small diffs together.
+_BATCH_TOKEN_BUDGET = 6000
+_BATCH_MAX_FILE_TOKENS = 1500
+
+# Sync SDK clients are shared across CodeReviewer instances so repeated
+# reviews reuse keep-alive connections instead of new TLS handshakes.
+_CLIENT_POOL: dict[tuple[str, str, str | None], Any] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
 
 class ReviewMode(Enum):
     QUICK = "quick"
@@ -23,7 +111,7 @@ class ReviewMode(Enum):
     DEEP = "deep"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ReviewConfig:
     provider: LLMProvider = LLMProvider.OPENAI
     model: str = "gpt-4"
@@ -32,7 +120,10 @@ class ReviewConfig:
     max_issues: int = 20
     include_positive_feedback: bool = True
     mode: ReviewMode = ReviewMode.STANDARD
-    language_rules: dict[str, Any] = field(default_factory=dict)
+    max_concurrency: int = 4
+    max_file_bytes: int = 256 * 1024
+    batch_small_files: bool = True
+    language_rules: Mapping[str, Any] = field(default_factory=lambda: _NO_RULES)
 
     @classmethod
     def from_file(cls, path: str | Path) -> ReviewConfig:
@@ -54,7 +145,9 @@ class ReviewConfig:
             ),
             max_issues=data.get("review", {}).get("max_comments", 20),
             include_positive_feedback=data.get("review", {}).get("include_positive", True),
-            language_rules=data.get("rules", {}),
+            max_concurrency=data.get("review", {}).get("max_concurrency", 4),
+            max_file_bytes=data.get("review", {}).get("max_file_bytes", 256 * 1024),
+            language_rules=MappingProxyType(data.get("rules") or {}),
         )
 
 
@@ -63,12 +156,16 @@ class CodeReviewer:
         self,
         config: ReviewConfig | None = None,
         api_key: str | None = None,
+        cache: bool = False,
     ):
         self.config = config or ReviewConfig()
         self.api_key = api_key or self._get_api_key()
         self.prompt_builder = PromptBuilder()
         self.diff_parser = DiffParser()
+        self.static_analyzer = FastAnalyzer()
+        self.cache_enabled = cache
         self._client = None
+        self._cache: ResponseCache | None = None
 
     def _get_api_key(self) -> str:
         env_vars = {
@@ -88,21 +185,46 @@ class CodeReviewer:
             self._client = self._create_client()
         return self._client
 
+    @property
+    def cache(self) -> ResponseCache | None:
+        if self._cache is None and self.cache_enabled:
+            self._cache = ResponseCache()
+        return self._cache
+
+    def _base_url(self) -> str | None:
+        if self.config.provider == LLMProvider.LOCAL:
+            return os.environ.get("LOCAL_LLM_URL", "http://localhost:11434/v1")
+        return None
+
     def _create_client(self) -> Any:
+        base_url = self._base_url()
+        key = (self.config.provider.value, self.api_key, base_url)
+        with _CLIENT_POOL_LOCK:
+            client = _CLIENT_POOL.get(key)
+            if client is None:
+                client = _CLIENT_POOL[key] = self._build_client(base_url)
+        return client
+
+    def _create_async_client(self) -> Any:
+        # Async clients are tied to the event loop they first run on, so they
+        # are created per review run rather than pooled.
+        return self._build_client(self._base_url(), use_async=True)
+
+    def _build_client(self, base_url: str | None, use_async: bool = False) -> Any:
         if self.config.provider == LLMProvider.OPENAI:
-            from openai import OpenAI
-            return OpenAI(api_key=self.api_key)
+            from openai import AsyncOpenAI, OpenAI
+            openai_cls = AsyncOpenAI if use_async else OpenAI
+            return openai_cls(api_key=self.api_key)
 
         elif self.config.provider == LLMProvider.ANTHROPIC:
-            from anthropic import Anthropic
-            return Anthropic(api_key=self.api_key)
+            from anthropic import Anthropic, AsyncAnthropic
+            anthropic_cls = AsyncAnthropic if use_async else Anthropic
+            return anthropic_cls(api_key=self.api_key)
 
         elif self.config.provider == LLMProvider.LOCAL:
-            from openai import OpenAI
-            return OpenAI(
-                base_url=os.environ.get("LOCAL_LLM_URL", "http://localhost:11434/v1"),
-                api_key="not-needed",
-            )
+            from openai import AsyncOpenAI, OpenAI
+            openai_cls = AsyncOpenAI if use_async else OpenAI
+            return openai_cls(base_url=base_url, api_key="not-needed")
 
         raise ValueError(f"Unsupported provider: {self.config.provider}")
 
@@ -112,68 +234,322 @@ class CodeReviewer:
         language: str | None = None,
         context: str | None = None,
         filename: str | None = None,
+        mode: ReviewMode | None = None,
     ) -> ReviewResult:
         if language is None:
             language = detect_language(code, filename)
 
-        prompt = self.prompt_builder.build_review_prompt(
+        mode = mode or self.config.mode
+        static_issues = self.static_analyzer.analyze(code, language)
+        quick = self._quick_result(code, language, mode, static_issues)
+        if quick is not None:
+            return quick
+
+        prompt = self._build_review_prompt(code, language, context, mode)
+
+        response = self._call_llm(prompt)
+
+        return self._llm_result(response, code, language, static_issues)
+
+    def _quick_result(
+        self,
+        code: str,
+        language: str,
+        mode: ReviewMode,
+        static_issues: list[Issue],
+    ) -> ReviewResult | None:
+        # Obvious findings are enough for a quick review; skip the LLM round trip.
+        if mode != ReviewMode.QUICK or not static_issues:
+            return None
+        return ReviewResult(
             code=code,
             language=language,
-            context=context,
-            mode=self.config.mode,
-            rules=self.config.language_rules.get(language, {}),
+            issues=static_issues,
+            summary=ReviewSummary.from_issues(static_issues),
         )
 
-        response = self._call_llm(prompt)
+    def _llm_result(
+        self,
+        response: str,
+        code: str,
+        language: str,
+        static_issues: list[Issue],
+    ) -> ReviewResult:
+        result = self._parse_review_response(response, code, language)
+        if static_issues:
+            self._merge_static_issues(result, static_issues)
+        return result
+
+    def _merge_static_issues(self, result: ReviewResult, static_issues: list[Issue]) -> None:
+        seen = {(issue.line, issue.type) for issue in result.issues}
+        extra = []
+        for issue in static_issues:
+            key = (issue.line, issue.type)
+            if key not in seen:
+                seen.add(key)
+                extra.append(issue)
+        if not extra:
+            return
+
+        result.issues.extend(extra)
+        raw_feedback = result.summary.raw_feedback
+        result.summary = ReviewSummary.from_issues(result.issues)
+        result.summary.raw_feedback = raw_feedback
+
+    def review_stream(
+        self,
+        code: str,
+        language: str | None = None,
+        context: str | None = None,
+        filename: str | None = None,
+        mode: ReviewMode | None = None,
+    ) -> Iterator[str]:
+        if language is None:
+            language = detect_language(code, filename)
 
-        return self._parse_review_response(response, code, language)
+        mode = mode or self.config.mode
+        static_issues = self.static_analyzer.analyze(code, language)
+        quick = self._quick_result(code, language, mode, static_issues)
+        if quick is not None:
+            yield json.dumps(quick.to_dict())
+            return
+
+        prompt = self._build_review_prompt(code, language, context, mode)
+
+        cache = self.cache
+        key = self._cache_key(prompt)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks = []
+        for chunk in self._stream_llm(prompt):
+            chunks.append(chunk)
+            yield chunk
+
+        # A later review() of the same code is then answered from the cache.
+        response = "".join(chunks)
+        if cache is not None and _cacheable(response):
+            cache.set(key, response)
+
+    def result_from_stream(
+        self,
+        response: str,
+        code: str,
+        language: str | None = None,
+        filename: str | None = None,
+    ) -> ReviewResult:
+        if language is None:
+            language = detect_language(code, filename)
+
+        static_issues = self.static_analyzer.analyze(code, language)
+        return self._llm_result(response, code, language, static_issues)
+
+    def _build_review_prompt(
+        self,
+        code: str,
+        language: str,
+        context: str | None,
+        mode: ReviewMode | None,
+    ) -> str:
+        return self.prompt_builder.build_review_prompt(
+            code=code,
+            language=language,
+            context=context,
+            mode=mode or self.config.mode,
+            rules=self.config.language_rules.get(language, {}),
+        )
 
     def review_file(self, file_path: str | Path) -> ReviewResult:
         path = Path(file_path)
+        code = self._read_source(path)
+        language = detect_language(code, str(path))
+
+        return self.review(code, language=language, filename=str(path))
+
+    async def areview_files(self, file_paths: list[str | Path]) -> list[ReviewResult | None]:
+        if not file_paths:
+            return []
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        async with self._create_async_client() as client:
+            return await asyncio.gather(
+                *(self._areview_file(client, Path(path), semaphore) for path in file_paths)
+            )
 
+    async def _areview_file(
+        self,
+        client: Any,
+        path: Path,
+        semaphore: asyncio.Semaphore,
+    ) -> ReviewResult | None:
+        # One unreadable file or failed request must not sink the rest of the batch.
+        try:
+            code = self._read_source(path)
+            language = detect_language(code, str(path))
+            static_issues = self.static_analyzer.analyze(code, language)
+            quick = self._quick_result(code, language, self.config.mode, static_issues)
+            if quick is not None:
+                return quick
+
+            prompt = self._build_review_prompt(code, language, None, None)
+            response = await self._acall_llm(client, prompt, semaphore)
+        except Exception:
+            return None
+
+        return self._llm_result(response, code, language, static_issues)
+
+    def _read_source(self, path: Path) -> str:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
-        code = path.read_text()
-        language = detect_language(code, str(path))
+        # Oversized (usually generated) files would not fit the model context anyway.
+        size = path.stat().st_size
+        if size > self.config.max_file_bytes:
+            raise ValueError(
+                f"File too large to review: {path} "
+                f"({size} bytes, limit {self.config.max_file_bytes})"
+            )
 
-        return self.review(code, language=language, filename=str(path))
+        return path.read_bytes().decode("utf-8", errors="replace")
 
     def review_diff(
         self,
         diff: str,
         base_content: dict[str, str] | None = None,
+    ) -> list[ReviewResult]:
+        return _run_sync(self.areview_diff(diff, base_content))
+
+    async def areview_diff(
+        self,
+        diff: str,
+        base_content: dict[str, str] | None = None,
     ) -> list[ReviewResult]:
         parsed = self.diff_parser.parse(diff)
-        results = []
+        if not parsed:
+            return []
+
+        base_lookup = base_content or {}
+        contexts = []
+        prompts = []
 
         for file_diff in parsed:
+            source = base_lookup.get(file_diff.file_path)
             file_context = None
-            if base_content and file_diff.file_path in base_content:
-                file_context = extract_code_context(
-                    base_content[file_diff.file_path],
-                    file_diff.hunks,
-                )
+            if source is not None:
+                file_context = extract_code_context(source, file_diff.hunks)
+            contexts.append(file_context)
 
-            prompt = self.prompt_builder.build_diff_review_prompt(
+            prompts.append(self.prompt_builder.build_diff_review_prompt(
                 file_path=file_diff.file_path,
                 hunks=file_diff.hunks,
                 context=file_context,
                 mode=self.config.mode,
+            ))
+
+        batches = self._plan_batches(prompts)
+        requests = [
+            prompts[batch[0]] if len(batch) == 1
+            else self.prompt_builder.build_batch_review_prompt(
+                [(parsed[i].file_path, parsed[i].hunks, contexts[i]) for i in batch],
+                mode=self.config.mode,
             )
+            for batch in batches
+        ]
+
+        async with self._create_async_client() as client:
+            responses = await self._acall_llm_many(client, requests)
+            results: list[ReviewResult | None] = [None] * len(parsed)
+            retry = []
+
+            for batch, response in zip(batches, responses):
+                if len(batch) == 1:
+                    results[batch[0]] = self._diff_result(parsed[batch[0]], response)
+                    continue
+
+                entries = _batch_entries(response)
+                for i in batch:
+                    result = self._diff_result_from_entry(parsed[i], entries.get(parsed[i].file_path))
+                    if result is None:
+                        retry.append(i)
+                    else:
+                        results[i] = result
+
+            if retry:
+                # Files the model left out of the multi-file schema are reviewed one by one.
+                responses = await self._acall_llm_many(
+                    client, [prompts[i] for i in retry]
+                )
+                for i, response in zip(retry, responses):
+                    results[i] = self._diff_result(parsed[i], response)
+
+        return [result for result in results if result is not None]
+
+    def _plan_batches(self, prompts: list[str]) -> list[list[int]]:
+        batches = []
+        current: list[int] = []
+        used = 0
+
+        for index, prompt in enumerate(prompts):
+            tokens = len(prompt) // 4
+            if not self.config.batch_small_files or tokens > _BATCH_MAX_FILE_TOKENS:
+                batches.append([index])
+                continue
+
+            if current and used + tokens > _BATCH_TOKEN_BUDGET:
+                batches.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _diff_result(self, file_diff: FileDiff, response: str) -> ReviewResult:
+        result = self._parse_review_response(
+            response,
+            file_diff.new_content,
+            detect_language("", file_diff.file_path),
+        )
+        result.file_path = file_diff.file_path
+        return result
 
-            response = self._call_llm(prompt)
-            result = self._parse_review_response(
-                response,
+    def _diff_result_from_entry(
+        self,
+        file_diff: FileDiff,
+        entry: dict[str, Any] | None,
+    ) -> ReviewResult | None:
+        if entry is None:
+            return None
+
+        try:
+            result = ReviewResult.from_dict(
+                entry,
                 file_diff.new_content,
                 detect_language("", file_diff.file_path),
             )
-            result.file_path = file_diff.file_path
-            results.append(result)
+        except (AttributeError, TypeError, ValueError):
+            return None
 
-        return results
+        result.file_path = file_diff.file_path
+        return result
 
     def review_staged(self, repo_path: str = ".") -> list[ReviewResult]:
+        diff = self._staged_diff(repo_path)
+
+        if not diff.strip():
+            return []
+
+        return self.review_diff(diff)
+
+    def _staged_diff(self, repo_path: str) -> str:
+        diff = self._staged_diff_pygit2(repo_path)
+        if diff is not None:
+            return diff
+
         import subprocess
 
         result = subprocess.run(
@@ -186,44 +562,132 @@ class CodeReviewer:
         if result.returncode != 0:
             raise RuntimeError(f"Git error: {result.stderr}")
 
-        if not result.stdout.strip():
-            return []
+        return result.stdout
 
-        return self.review_diff(result.stdout)
+    def _staged_diff_pygit2(self, repo_path: str) -> str | None:
+        try:
+            import pygit2
+        except ImportError:
+            return None
+
+        # In-process libgit2 avoids a fork/exec per call (pre-commit hooks).
+        try:
+            git_dir = pygit2.discover_repository(repo_path)
+            if git_dir is not None:
+                repo = pygit2.Repository(git_dir)
+                if not repo.head_is_unborn:
+                    return repo.diff("HEAD", cached=True).patch or ""
+        except pygit2.GitError:
+            pass
+        return None
+
+    def _cache_key(self, prompt: str) -> str:
+        return make_cache_key(
+            self.config.provider.value,
+            self.config.model,
+            self._base_url(),
+            self.config.temperature,
+            self.prompt_builder.system_prompt,
+            prompt,
+        )
 
     def _call_llm(self, prompt: str) -> str:
-        if self.config.provider == LLMProvider.OPENAI:
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                messages=[
+        cache = self.cache
+        if cache is None:
+            return self._request_llm(prompt)
+
+        key = self._cache_key(prompt)
+        response = cache.get(key)
+        if response is None:
+            response = self._request_llm(prompt)
+            if _cacheable(response):
+                cache.set(key, response)
+        return response
+
+    def _anthropic_system(self) -> list[dict[str, Any]]:
+        # Mark the shared system prompt as a cacheable prefix for Anthropic.
+        return [{
+            "type": "text",
+            "text": self.prompt_builder.system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
+
+    async def _acall_llm_many(self, client: Any, prompts: list[str]) -> list[str]:
+        # Bound in-flight requests so large diffs stay under provider rate limits.
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        return await asyncio.gather(
+            *(self._acall_llm(client, prompt, semaphore) for prompt in prompts)
+        )
+
+    async def _acall_llm(
+        self,
+        client: Any,
+        prompt: str,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        cache = self.cache
+        if cache is None:
+            async with semaphore:
+                return await self._arequest_llm(client, prompt)
+
+        key = self._cache_key(prompt)
+        response = cache.get(key)
+        if response is None:
+            async with semaphore:
+                response = await self._arequest_llm(client, prompt)
+            if _cacheable(response):
+                cache.set(key, response)
+        return response
+
+    def _request_kwargs(self, prompt: str) -> dict[str, Any]:
+        if self.config.provider in (LLMProvider.OPENAI, LLMProvider.LOCAL):
+            return {
+                "model": self.config.model,
+                "messages": [
                     {"role": "system", "content": self.prompt_builder.system_prompt},
                     {"role": "user", "content": prompt},
                 ],
-                temperature=self.config.temperature,
-            )
-            return response.choices[0].message.content
+                "temperature": self.config.temperature,
+            }
 
         elif self.config.provider == LLMProvider.ANTHROPIC:
-            response = self.client.messages.create(
-                model=self.config.model,
-                max_tokens=4096,
-                system=self.prompt_builder.system_prompt,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            return {
+                "model": self.config.model,
+                "max_tokens": 4096,
+                "system": self._anthropic_system(),
+                "messages": [{"role": "user", "content": prompt}],
+            }
+
+        raise ValueError(f"Unsupported provider: {self.config.provider}")
+
+    async def _arequest_llm(self, client: Any, prompt: str) -> str:
+        kwargs = self._request_kwargs(prompt)
+        if self.config.provider == LLMProvider.ANTHROPIC:
+            response = await client.messages.create(**kwargs)
             return response.content[0].text
 
-        elif self.config.provider == LLMProvider.LOCAL:
-            response = self.client.chat.completions.create(
-                model=self.config.model,
-                messages=[
-                    {"role": "system", "content": self.prompt_builder.system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=self.config.temperature,
-            )
-            return response.choices[0].message.content
+        response = await client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
 
-        raise ValueError(f"Unsupported provider: {self.config.provider}")
+    def _stream_llm(self, prompt: str) -> Iterator[str]:
+        kwargs = self._request_kwargs(prompt)
+        if self.config.provider == LLMProvider.ANTHROPIC:
+            with self.client.messages.stream(**kwargs) as stream:
+                yield from stream.text_stream
+            return
+
+        for chunk in self.client.chat.completions.create(**kwargs, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _request_llm(self, prompt: str) -> str:
+        kwargs = self._request_kwargs(prompt)
+        if self.config.provider == LLMProvider.ANTHROPIC:
+            response = self.client.messages.create(**kwargs)
+            return response.content[0].text
+
+        response = self.client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
 
     def _parse_review_response(
         self,
@@ -231,22 +695,9 @@ class CodeReviewer:
         code: str,
         language: str,
     ) -> ReviewResult:
-        import json
-        import re
-        json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-
-        if json_match:
-            try:
-                data = json.loads(json_match.group(1))
-                return ReviewResult.from_dict(data, code, language)
-            except json.JSONDecodeError:
-                pass
-
-        try:
-            data = json.loads(response)
+        data = _extract_json(response)
+        if data is not None:
             return ReviewResult.from_dict(data, code, language)
-        except json.JSONDecodeError:
-            pass
 
         return ReviewResult(
             code=code,
@@ -1,40 +1,83 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from .._compat import DATACLASS_SLOTS
 
-class Severity(Enum):
+
+# The str mixin gives members str's C-level hash, so the lookup tables
+# below (and the type counts in ReviewSummary) don't call back into Enum.__hash__.
+# Values stay the lowercase strings used in config files and JSON output.
+class Severity(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
-    def __lt__(self, other: Severity) -> bool:
-        order = [Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL]
-        return order.index(self) < order.index(other)
+    # All four are needed: the str mixin would otherwise answer >, <= and >=
+    # alphabetically.
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Severity):
+            return NotImplemented
+        return _SEVERITY_RANK[self] < _SEVERITY_RANK[other]
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Severity):
+            return NotImplemented
+        return _SEVERITY_RANK[self] <= _SEVERITY_RANK[other]
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Severity):
+            return NotImplemented
+        return _SEVERITY_RANK[self] > _SEVERITY_RANK[other]
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Severity):
+            return NotImplemented
+        return _SEVERITY_RANK[self] >= _SEVERITY_RANK[other]
 
     @property
     def emoji(self) -> str:
-        return {
-            Severity.LOW: "💡",
-            Severity.MEDIUM: "⚠️",
-            Severity.HIGH: "🔴",
-            Severity.CRITICAL: "🚨",
-        }[self]
+        return _SEVERITY_EMOJI[self]
 
     @property
     def color(self) -> str:
-        return {
-            Severity.LOW: "\033[94m",
-            Severity.MEDIUM: "\033[93m",
-            Severity.HIGH: "\033[91m",
-            Severity.CRITICAL: "\033[95m",
-        }[self]
-
-
-class IssueType(Enum):
+        return _SEVERITY_COLOR[self]
+
+
+_SEVERITY_RANK = {
+    Severity.LOW: 0,
+    Severity.MEDIUM: 1,
+    Severity.HIGH: 2,
+    Severity.CRITICAL: 3,
+}
+
+_SEVERITY_EMOJI = {
+    Severity.LOW: "💡",
+    Severity.MEDIUM: "⚠️",
+    Severity.HIGH: "🔴",
+    Severity.CRITICAL: "🚨",
+}
+
+_SEVERITY_COLOR = {
+    Severity.LOW: "\033[94m",
+    Severity.MEDIUM: "\033[93m",
+    Severity.HIGH: "\033[91m",
+    Severity.CRITICAL: "\033[95m",
+}
+
+_SEVERITY_WEIGHT = {
+    Severity.CRITICAL: 3.0,
+    Severity.HIGH: 2.0,
+    Severity.MEDIUM: 1.0,
+    Severity.LOW: 0.5,
+}
+
+
+class IssueType(str, Enum):
     BUG = "bug"
     SECURITY = "security"
     PERFORMANCE = "performance"
@@ -46,16 +89,30 @@ class IssueType(Enum):
 
     @property
     def emoji(self) -> str:
-        return {
-            IssueType.BUG: "🐛",
-            IssueType.SECURITY: "🔒",
-            IssueType.PERFORMANCE: "⚡",
-            IssueType.STYLE: "🎨",
-            IssueType.MAINTAINABILITY: "🔧",
-            IssueType.DOCUMENTATION: "📝",
-            IssueType.BEST_PRACTICE: "✨",
-            IssueType.TYPE_ERROR: "🔤",
-        }[self]
+        return _ISSUE_EMOJI[self]
+
+
+_ISSUE_EMOJI = {
+    IssueType.BUG: "🐛",
+    IssueType.SECURITY: "🔒",
+    IssueType.PERFORMANCE: "⚡",
+    IssueType.STYLE: "🎨",
+    IssueType.MAINTAINABILITY: "🔧",
+    IssueType.DOCUMENTATION: "📝",
+    IssueType.BEST_PRACTICE: "✨",
+    IssueType.TYPE_ERROR: "🔤",
+}
+
+
+_SEVERITY_BY_VALUE = {member.value: member for member in Severity}
+_ISSUE_TYPE_BY_VALUE = {member.value: member for member in IssueType}
+
+
+def _member(enum_cls: type[Enum], by_value: dict[Any, Any], value: Any) -> Any:
+    try:
+        return by_value[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
 
 
 class LLMProvider(Enum):
@@ -64,7 +121,7 @@ class LLMProvider(Enum):
     LOCAL = "local"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Issue:
     type: IssueType
     severity: Severity
@@ -78,22 +135,26 @@ class Issue:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Issue:
+        # Positional in field order: keyword arguments nearly double the
+        # construction cost for the many issues a deep review can return.
+        get = data.get
         return cls(
-            type=IssueType(data.get("type", "bug")),
-            severity=Severity(data.get("severity", "medium")),
-            line=data.get("line", 1),
-            end_line=data.get("end_line"),
-            column=data.get("column"),
-            message=data.get("message", ""),
-            suggestion=data.get("suggestion"),
-            code_suggestion=data.get("code_suggestion"),
-            rule_id=data.get("rule_id"),
+            _member(IssueType, _ISSUE_TYPE_BY_VALUE, get("type", "bug")),
+            _member(Severity, _SEVERITY_BY_VALUE, get("severity", "medium")),
+            get("line", 1),
+            get("message", ""),
+            get("suggestion"),
+            get("code_suggestion"),
+            get("end_line"),
+            get("column"),
+            get("rule_id"),
         )
 
     def to_dict(self) -> dict[str, Any]:
+        # _value_ is a plain attribute; .value goes through the enum property.
         return {
-            "type": self.type.value,
-            "severity": self.severity.value,
+            "type": self.type._value_,
+            "severity": self.severity._value_,
             "line": self.line,
             "end_line": self.end_line,
             "column": self.column,
@@ -104,24 +165,23 @@ class Issue:
         }
 
     def format(self, show_colors: bool = True) -> str:
+        return "\n".join(self._format_lines(show_colors))
+
+    def _format_lines(self, show_colors: bool = True) -> Iterator[str]:
         reset = "\033[0m" if show_colors else ""
         color = self.severity.color if show_colors else ""
 
-        lines = [
-            f"{color}{self.severity.emoji} {self.type.value.upper()} (Line {self.line}){reset}",
-            f"   {self.message}",
-        ]
+        yield f"{color}{self.severity.emoji} {self.type.value.upper()} (Line {self.line}){reset}"
+        yield f"   {self.message}"
 
         if self.suggestion:
-            lines.append(f"\n   💡 Suggestion: {self.suggestion}")
+            yield f"\n   💡 Suggestion: {self.suggestion}"
 
         if self.code_suggestion:
-            lines.append(f"\n   ```\n   {self.code_suggestion}\n   ```")
+            yield f"\n   ```\n   {self.code_suggestion}\n   ```"
 
-        return "\n".join(lines)
 
-
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReviewSummary:
     total_issues: int
     bugs: int = 0
@@ -133,30 +193,35 @@ class ReviewSummary:
 
     @classmethod
     def from_issues(cls, issues: list[Issue]) -> ReviewSummary:
-        type_counts = dict.fromkeys(IssueType, 0)
+        type_counts: dict[IssueType, int] = {}
+        penalty = 0.0
         for issue in issues:
-            type_counts[issue.type] += 1
+            type_counts[issue.type] = type_counts.get(issue.type, 0) + 1
+            penalty += _SEVERITY_WEIGHT[issue.severity]
 
-        weights = {
-            Severity.CRITICAL: 3.0,
-            Severity.HIGH: 2.0,
-            Severity.MEDIUM: 1.0,
-            Severity.LOW: 0.5,
-        }
-        penalty = sum(weights[i.severity] for i in issues)
         quality_score = max(0, min(10, 10 - penalty))
 
         return cls(
             total_issues=len(issues),
-            bugs=type_counts[IssueType.BUG],
-            security_issues=type_counts[IssueType.SECURITY],
-            performance_issues=type_counts[IssueType.PERFORMANCE],
-            style_issues=type_counts[IssueType.STYLE],
+            bugs=type_counts.get(IssueType.BUG, 0),
+            security_issues=type_counts.get(IssueType.SECURITY, 0),
+            performance_issues=type_counts.get(IssueType.PERFORMANCE, 0),
+            style_issues=type_counts.get(IssueType.STYLE, 0),
             quality_score=round(quality_score, 1),
         )
 
 
-@dataclass
+_RULE = "━" * 50
+_CLEAN_REVIEW = (
+    f"🔍 Code Review Results\n{_RULE}\n\n"
+    "{file}✅ No issues found! Great code!\n"
+    f"{_RULE}\n"
+    "Summary: {summary.bugs} bugs, {summary.security_issues} security, "
+    "{summary.style_issues} style | Quality Score: {summary.quality_score}/10"
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ReviewResult:
     code: str
     language: str
@@ -204,39 +269,44 @@ class ReviewResult:
         return [i for i in self.issues if i.type == issue_type]
 
     def __str__(self) -> str:
-        lines = [
-            "🔍 Code Review Results",
-            "━" * 50,
-            "",
-        ]
+        if not self.issues and not self.positive_feedback:
+            # Most files in a repo-wide run come back clean.
+            return _CLEAN_REVIEW.format(
+                file=f"📁 File: {self.file_path}\n\n" if self.file_path else "",
+                summary=self.summary,
+            )
+        return "\n".join(self._format_lines())
+
+    def _format_lines(self) -> Iterator[str]:
+        yield "🔍 Code Review Results"
+        yield _RULE
+        yield ""
 
         if self.file_path:
-            lines.append(f"📁 File: {self.file_path}")
-            lines.append("")
+            yield f"📁 File: {self.file_path}"
+            yield ""
 
         if not self.issues:
-            lines.append("✅ No issues found! Great code!")
+            yield "✅ No issues found! Great code!"
         else:
             for issue in self.issues:
-                lines.append(issue.format())
-                lines.append("")
+                yield from issue._format_lines()
+                yield ""
 
         if self.positive_feedback:
-            lines.append("✨ Positive Feedback:")
+            yield "✨ Positive Feedback:"
             for fb in self.positive_feedback:
-                lines.append(f"   • {fb}")
-            lines.append("")
+                yield f"   • {fb}"
+            yield ""
 
-        lines.append("━" * 50)
-        lines.append(
+        yield _RULE
+        yield (
             f"Summary: {self.summary.bugs} bugs, "
             f"{self.summary.security_issues} security, "
             f"{self.summary.style_issues} style | "
             f"Quality Score: {self.summary.quality_score}/10"
         )
 
-        return "\n".join(lines)
-
     def __repr__(self) -> str:
         return (
             f"ReviewResult(issues={len(self.issues)}, "
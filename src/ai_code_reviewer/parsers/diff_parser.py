@@ -3,6 +3,9 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
+
+from .._compat import DATACLASS_SLOTS
 
 
 class LineType(Enum):
@@ -11,7 +14,7 @@ class LineType(Enum):
     DELETION = "deletion"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DiffLine:
     content: str
     line_type: LineType
@@ -23,6 +26,18 @@ class DiffLine:
         return self.line_type in (LineType.ADDITION, LineType.DELETION)
 
 
+_LINE_PREFIX = {
+    LineType.CONTEXT: " ",
+    LineType.ADDITION: "+",
+    LineType.DELETION: "-",
+}
+
+
+
+def _aggregate() -> Any:
+    return field(default=None, init=False, repr=False, compare=False)
+
+
 @dataclass
 class DiffHunk:
     old_start: int
@@ -31,29 +46,44 @@ class DiffHunk:
     new_count: int
     lines: list[DiffLine] = field(default_factory=list)
     header: str = ""
+    # Set by finalize() once the lines are complete; until then the
+    # aggregates are computed from the lines on every access.
+    _additions: list[DiffLine] | None = _aggregate()
+    _deletions: list[DiffLine] | None = _aggregate()
+    _changed_new_lines: list[int] | None = _aggregate()
+
+    def finalize(self) -> None:
+        self._additions = self._select(LineType.ADDITION)
+        self._deletions = self._select(LineType.DELETION)
+        self._changed_new_lines = self._new_line_numbers(self._additions)
+
+    def _select(self, line_type: LineType) -> list[DiffLine]:
+        return [line for line in self.lines if line.line_type is line_type]
+
+    @staticmethod
+    def _new_line_numbers(additions: list[DiffLine]) -> list[int]:
+        return [line.new_line_number for line in additions if line.new_line_number]
 
     @property
     def additions(self) -> list[DiffLine]:
-        return [line for line in self.lines if line.line_type == LineType.ADDITION]
+        if self._additions is not None:
+            return self._additions
+        return self._select(LineType.ADDITION)
 
     @property
     def deletions(self) -> list[DiffLine]:
-        return [line for line in self.lines if line.line_type == LineType.DELETION]
+        if self._deletions is not None:
+            return self._deletions
+        return self._select(LineType.DELETION)
 
     @property
     def changed_new_lines(self) -> list[int]:
-        return [line.new_line_number for line in self.additions if line.new_line_number]
+        if self._changed_new_lines is not None:
+            return self._changed_new_lines
+        return self._new_line_numbers(self.additions)
 
     def get_context(self, _lines: int = 3) -> str:
-        result = []
-        for line in self.lines:
-            prefix = {
-                LineType.CONTEXT: " ",
-                LineType.ADDITION: "+",
-                LineType.DELETION: "-",
-            }[line.line_type]
-            result.append(f"{prefix}{line.content}")
-        return "\n".join(result)
+        return "\n".join(f"{_LINE_PREFIX[line.line_type]}{line.content}" for line in self.lines)
 
 
 @dataclass
@@ -64,24 +94,36 @@ class FileDiff:
     is_new_file: bool = False
     is_deleted_file: bool = False
     is_renamed: bool = False
+    _old_content: str | None = _aggregate()
+    _new_content: str | None = _aggregate()
+
+    def finalize(self) -> None:
+        for hunk in self.hunks:
+            hunk.finalize()
+        self._old_content = self._join(LineType.ADDITION)
+        self._new_content = self._join(LineType.DELETION)
+
+    # str.join materializes a generator into a list first, so passing the
+    # list comprehension directly is the cheaper form.
+    def _join(self, skipped: LineType) -> str:
+        return "\n".join([
+            line.content
+            for hunk in self.hunks
+            for line in hunk.lines
+            if line.line_type is not skipped
+        ])
 
     @property
     def old_content(self) -> str:
-        lines = []
-        for hunk in self.hunks:
-            for line in hunk.lines:
-                if line.line_type != LineType.ADDITION:
-                    lines.append(line.content)
-        return "\n".join(lines)
+        if self._old_content is not None:
+            return self._old_content
+        return self._join(LineType.ADDITION)
 
     @property
     def new_content(self) -> str:
-        lines = []
-        for hunk in self.hunks:
-            for line in hunk.lines:
-                if line.line_type != LineType.DELETION:
-                    lines.append(line.content)
-        return "\n".join(lines)
+        if self._new_content is not None:
+            return self._new_content
+        return self._join(LineType.DELETION)
 
     @property
     def total_additions(self) -> int:
@@ -99,106 +141,59 @@ class DiffParser:
     HUNK_HEADER_PATTERN = re.compile(
         r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$'
     )
+    # Matches every line of a diff exactly once. Hunk body lines are the
+    # bulk of any diff, so they are tried first; their leading character and
+    # the "+++"/"---" lookaheads keep them disjoint from the header lines.
+    LINE_PATTERN = re.compile(
+        r'^(?:'
+        r'(?P<add>\+(?!\+\+)(?P<added>.*))'
+        r'|(?P<delete>-(?!--)(?P<deleted>.*))'
+        r'|(?P<context> (?P<text>.*)|)'
+        r'|(?P<file>diff --git a/(?P<old_path>.*) b/(?P<new_path>.*))'
+        r'|(?P<new_file>new file mode.*)'
+        r'|(?P<deleted_file>deleted file mode.*)'
+        r'|(?P<rename>rename (?:from|to).*)'
+        r'|(?P<old_file>--- .*)'
+        r'|(?P<new_header>\+\+\+ (?:b/)?(?P<header_path>.*))'
+        r'|(?P<hunk>@@ -(?P<old_start>\d+)(?:,(?P<old_count>\d+))? '
+        r'\+(?P<new_start>\d+)(?:,(?P<new_count>\d+))? @@(?P<section>.*))'
+        r'|(?P<other>.*)'
+        r')$',
+        re.MULTILINE,
+    )
 
     def parse(self, diff: str) -> list[FileDiff]:
-        lines = diff.split('\n')
         file_diffs: list[FileDiff] = []
         current_file: FileDiff | None = None
         current_hunk: DiffHunk | None = None
         old_line = 0
         new_line = 0
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            file_match = self.FILE_HEADER_PATTERN.match(line)
-            if file_match:
-                if current_file:
-                    file_diffs.append(current_file)
-                current_file = FileDiff(
-                    file_path=file_match.group(2),
-                    old_path=file_match.group(1),
-                )
-                current_hunk = None
-                i += 1
-                continue
-
-            if line.startswith('new file mode'):
-                if current_file:
-                    current_file.is_new_file = True
-                i += 1
-                continue
-
-            if line.startswith('deleted file mode'):
-                if current_file:
-                    current_file.is_deleted_file = True
-                i += 1
-                continue
-
-            if line.startswith('rename from') or line.startswith('rename to'):
-                if current_file:
-                    current_file.is_renamed = True
-                i += 1
-                continue
-
-            old_match = self.OLD_FILE_PATTERN.match(line)
-            if old_match:
-                if not current_file:
-                    current_file = FileDiff(file_path="")
-                i += 1
-                continue
-
-            new_match = self.NEW_FILE_PATTERN.match(line)
-            if new_match:
-                if current_file and not current_file.file_path:
-                    path = new_match.group(1)
-                    if path != '/dev/null':
-                        current_file.file_path = path
-                i += 1
-                continue
-
-            hunk_match = self.HUNK_HEADER_PATTERN.match(line)
-            if hunk_match:
-                if current_hunk and current_file:
-                    current_file.hunks.append(current_hunk)
-
-                old_start = int(hunk_match.group(1))
-                old_count = int(hunk_match.group(2) or 1)
-                new_start = int(hunk_match.group(3))
-                new_count = int(hunk_match.group(4) or 1)
-
-                current_hunk = DiffHunk(
-                    old_start=old_start,
-                    old_count=old_count,
-                    new_start=new_start,
-                    new_count=new_count,
-                    header=hunk_match.group(5).strip(),
-                )
-                old_line = old_start
-                new_line = new_start
-                i += 1
-                continue
+        for match in self.LINE_PATTERN.finditer(diff):
+            kind = match.lastgroup
 
-            if current_hunk is not None:
-                if line.startswith('+') and not line.startswith('+++'):
+            if kind == 'add':
+                if current_hunk is not None:
                     current_hunk.lines.append(DiffLine(
-                        content=line[1:],
+                        content=match['added'],
                         line_type=LineType.ADDITION,
                         new_line_number=new_line,
                     ))
                     new_line += 1
-                elif line.startswith('-') and not line.startswith('---'):
+
+            elif kind == 'delete':
+                if current_hunk is not None:
                     current_hunk.lines.append(DiffLine(
-                        content=line[1:],
+                        content=match['deleted'],
                         line_type=LineType.DELETION,
                         old_line_number=old_line,
                     ))
                     old_line += 1
-                elif line.startswith(' ') or line == '':
-                    content = line[1:] if line.startswith(' ') else line
+
+            elif kind == 'context':
+                if current_hunk is not None:
                     current_hunk.lines.append(DiffLine(
-                        content=content,
+                        content=match['text'] or '',
                         line_type=LineType.CONTEXT,
                         old_line_number=old_line,
                         new_line_number=new_line,
@@ -206,13 +201,56 @@ class DiffParser:
                     old_line += 1
                     new_line += 1
 
-            i += 1
+            elif kind == 'hunk':
+                if current_hunk and current_file:
+                    current_file.hunks.append(current_hunk)
+
+                old_start = int(match['old_start'])
+                new_start = int(match['new_start'])
+                current_hunk = DiffHunk(
+                    old_start=old_start,
+                    old_count=int(match['old_count'] or 1),
+                    new_start=new_start,
+                    new_count=int(match['new_count'] or 1),
+                    header=match['section'].strip(),
+                )
+                old_line = old_start
+                new_line = new_start
+
+            elif kind == 'file':
+                if current_file:
+                    file_diffs.append(current_file)
+                current_file = FileDiff(
+                    file_path=match['new_path'],
+                    old_path=match['old_path'],
+                )
+                current_hunk = None
+
+            elif kind == 'old_file':
+                if not current_file:
+                    current_file = FileDiff(file_path="")
+
+            elif kind == 'new_header':
+                if current_file and not current_file.file_path:
+                    path = match['header_path']
+                    if path != '/dev/null':
+                        current_file.file_path = path
+
+            elif current_file:
+                if kind == 'new_file':
+                    current_file.is_new_file = True
+                elif kind == 'deleted_file':
+                    current_file.is_deleted_file = True
+                elif kind == 'rename':
+                    current_file.is_renamed = True
 
         if current_hunk and current_file:
             current_file.hunks.append(current_hunk)
         if current_file:
             file_diffs.append(current_file)
 
+        for file_diff in file_diffs:
+            file_diff.finalize()
         return file_diffs
 
     def parse_file(self, file_path: str) -> list[FileDiff]:
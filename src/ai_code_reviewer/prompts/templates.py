@@ -1,16 +1,33 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from ..analyzer import ReviewMode
     from ..parsers.diff_parser import DiffHunk
 
 
-class PromptBuilder:
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert code reviewer with deep knowledge of software engineering best practices, security, performance optimization, and clean code principles.
+# Static prompt text, with the newlines that separate it from its
+# neighbours already embedded.
+_REVIEW_HEADER = "Please review the following {language} code:\n\n```{language}\n"
+_REVIEW_CODE_END = "\n```\n"
+_RULES_HEADER = "\n\nAdditional rules to check:"
+_JSON_REMINDER = "\nProvide your review in JSON format as specified in the system prompt."
+_DIFF_FOCUS = (
+    "\nFocus on the ADDED lines (+ prefix). "
+    "Report line numbers from the NEW file version."
+)
+_BATCH_FOCUS = (
+    "\nFocus on the ADDED lines (+ prefix). "
+    "Report line numbers from the NEW version of each file."
+)
+_BATCH_RESPONSE_FORMAT = (
+    "\nRespond with a single JSON object of the form "
+    '{"files": [{"file": "<path>", "issues": [...], "positive_feedback": [...]}]} '
+    "containing one entry per file, where issues use the format from the system prompt."
+)
+
+_SYSTEM_PROMPT = """You are an expert code reviewer with deep knowledge of software engineering best practices, security, performance optimization, and clean code principles.
 
 Your role is to:
 1. Identify bugs, security vulnerabilities, and potential runtime errors
@@ -45,6 +62,44 @@ Always respond in valid JSON format with the following structure:
     "summary": "Brief overall assessment"
 }"""
 
+_MODE_INSTRUCTIONS = {
+    "quick": (
+        "\nMode: QUICK REVIEW\n"
+        "Focus only on critical bugs and security issues. "
+        "Skip minor style suggestions."
+    ),
+    "standard": (
+        "\nMode: STANDARD REVIEW\n"
+        "Provide a balanced review covering bugs, security, "
+        "performance, and important style issues."
+    ),
+    "deep": (
+        "\nMode: DEEP REVIEW\n"
+        "Perform a thorough analysis. Include:\n"
+        "- All potential bugs and edge cases\n"
+        "- Security vulnerabilities\n"
+        "- Performance optimizations\n"
+        "- Code style and maintainability\n"
+        "- Design pattern suggestions\n"
+        "- Test coverage recommendations"
+    ),
+}
+
+_RULE_DESCRIPTIONS = {
+    "check_types": "Verify type hints are correct and complete",
+    "docstring_required": "All public functions must have docstrings",
+    "max_complexity": "Flag functions with high cyclomatic complexity",
+    "prefer_const": "Prefer const over let for unchanging variables",
+    "no_var": "Disallow var, use let/const instead",
+    "no_any": "Avoid using 'any' type in TypeScript",
+    "error_handling": "Ensure proper error handling",
+    "null_safety": "Check for potential null/undefined issues",
+}
+
+
+class PromptBuilder:
+    system_prompt: ClassVar[str] = _SYSTEM_PROMPT
+
     def build_review_prompt(
         self,
         code: str,
@@ -53,33 +108,32 @@ Always respond in valid JSON format with the following structure:
         mode: ReviewMode | None = None,
         rules: dict | None = None,
     ) -> str:
-        numbered_code = self._add_line_numbers(code)
-
         prompt_parts = [
-            f"Please review the following {language} code:\n",
-            "```" + language,
-            numbered_code,
-            "```\n",
+            _REVIEW_HEADER.format(language=language),
+            self._add_line_numbers(code),
+            _REVIEW_CODE_END,
         ]
 
         if context:
-            prompt_parts.append(f"\nContext: {context}\n")
+            prompt_parts.append(f"\n\nContext: {context}\n")
 
         if rules:
-            prompt_parts.append("\nAdditional rules to check:")
-            for rule, enabled in rules.items():
-                if enabled:
-                    prompt_parts.append(f"- {self._format_rule(rule)}")
-            prompt_parts.append("")
+            prompt_parts.append(_RULES_HEADER)
+            prompt_parts.extend(
+                f"\n- {self._format_rule(rule)}"
+                for rule, enabled in rules.items()
+                if enabled
+            )
+            prompt_parts.append("\n")
 
         if mode:
+            prompt_parts.append("\n")
             prompt_parts.append(self._get_mode_instructions(mode))
 
-        prompt_parts.append(
-            "\nProvide your review in JSON format as specified in the system prompt."
-        )
+        prompt_parts.append("\n")
+        prompt_parts.append(_JSON_REMINDER)
 
-        return "\n".join(prompt_parts)
+        return "".join(prompt_parts)
 
     def build_diff_review_prompt(
         self,
@@ -91,84 +145,74 @@ Always respond in valid JSON format with the following structure:
         prompt_parts = [
             f"Please review the following changes to `{file_path}`:\n",
         ]
+        prompt_parts.extend(self._diff_sections(hunks, context))
 
-        for i, hunk in enumerate(hunks):
-            prompt_parts.append(f"\n### Change {i + 1} (lines {hunk.new_start}-{hunk.new_start + hunk.new_count}):")
-            if hunk.header:
-                prompt_parts.append(f"Function/Class: {hunk.header}")
-            prompt_parts.append("```diff")
-            prompt_parts.append(hunk.get_context())
-            prompt_parts.append("```")
+        prompt_parts.append(_DIFF_FOCUS)
 
-        if context:
-            prompt_parts.append("\n### Full File Context:")
-            prompt_parts.append("```")
-            prompt_parts.append(context[:2000])
-            if len(context) > 2000:
-                prompt_parts.append("... (truncated)")
-            prompt_parts.append("```")
+        if mode:
+            prompt_parts.append(self._get_mode_instructions(mode))
+
+        prompt_parts.append(_JSON_REMINDER)
 
-        prompt_parts.append(
-            "\nFocus on the ADDED lines (+ prefix). "
-            "Report line numbers from the NEW file version."
-        )
+        return "\n".join(prompt_parts)
+
+    def build_batch_review_prompt(
+        self,
+        files: list[tuple[str, list[DiffHunk], str | None]],
+        mode: ReviewMode | None = None,
+    ) -> str:
+        prompt_parts = [
+            f"Please review the following changes to {len(files)} files. "
+            "Each file starts with a `## FILE:` heading.\n",
+        ]
+
+        for file_path, hunks, context in files:
+            prompt_parts.append(f"\n## FILE: {file_path}")
+            prompt_parts.extend(self._diff_sections(hunks, context))
+
+        prompt_parts.append(_BATCH_FOCUS)
 
         if mode:
             prompt_parts.append(self._get_mode_instructions(mode))
 
-        prompt_parts.append(
-            "\nProvide your review in JSON format as specified in the system prompt."
-        )
+        prompt_parts.append(_BATCH_RESPONSE_FORMAT)
 
         return "\n".join(prompt_parts)
 
+    def _diff_sections(self, hunks: list[DiffHunk], context: str | None) -> list[str]:
+        parts = []
+
+        for i, hunk in enumerate(hunks):
+            parts.append(f"\n### Change {i + 1} (lines {hunk.new_start}-{hunk.new_start + hunk.new_count}):")
+            if hunk.header:
+                parts.append(f"Function/Class: {hunk.header}")
+            parts.append("```diff")
+            parts.append(hunk.get_context())
+            parts.append("```")
+
+        if context:
+            parts.append("\n### Full File Context:")
+            parts.append("```")
+            parts.append(context[:2000])
+            if len(context) > 2000:
+                parts.append("... (truncated)")
+            parts.append("```")
+
+        return parts
+
     def _add_line_numbers(self, code: str) -> str:
         lines = code.split('\n')
         width = len(str(len(lines)))
-        numbered = []
-        for i, line in enumerate(lines, 1):
-            numbered.append(f"{i:>{width}} | {line}")
-        return '\n'.join(numbered)
+        # rjust is much cheaper than a nested format spec like {i:>{width}}.
+        return '\n'.join([f"{str(i).rjust(width)} | {line}" for i, line in enumerate(lines, 1)])
 
     def _format_rule(self, rule: str) -> str:
-        rule_descriptions = {
-            "check_types": "Verify type hints are correct and complete",
-            "docstring_required": "All public functions must have docstrings",
-            "max_complexity": "Flag functions with high cyclomatic complexity",
-            "prefer_const": "Prefer const over let for unchanging variables",
-            "no_var": "Disallow var, use let/const instead",
-            "no_any": "Avoid using 'any' type in TypeScript",
-            "error_handling": "Ensure proper error handling",
-            "null_safety": "Check for potential null/undefined issues",
-        }
-        return rule_descriptions.get(rule, rule.replace('_', ' ').title())
+        description = _RULE_DESCRIPTIONS.get(rule)
+        return description if description is not None else rule.replace('_', ' ').title()
 
     def _get_mode_instructions(self, mode: ReviewMode) -> str:
-        from ..analyzer import ReviewMode
-
-        instructions = {
-            ReviewMode.QUICK: (
-                "\nMode: QUICK REVIEW\n"
-                "Focus only on critical bugs and security issues. "
-                "Skip minor style suggestions."
-            ),
-            ReviewMode.STANDARD: (
-                "\nMode: STANDARD REVIEW\n"
-                "Provide a balanced review covering bugs, security, "
-                "performance, and important style issues."
-            ),
-            ReviewMode.DEEP: (
-                "\nMode: DEEP REVIEW\n"
-                "Perform a thorough analysis. Include:\n"
-                "- All potential bugs and edge cases\n"
-                "- Security vulnerabilities\n"
-                "- Performance optimizations\n"
-                "- Code style and maintainability\n"
-                "- Design pattern suggestions\n"
-                "- Test coverage recommendations"
-            ),
-        }
-        return instructions.get(mode, "")
+        # Keyed by value so this module needn't import ReviewMode at runtime.
+        return _MODE_INSTRUCTIONS.get(mode.value, "")
 
 
 SECURITY_REVIEW_PROMPT = """
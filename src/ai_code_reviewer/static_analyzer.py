@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import ast
+
+from .models.reviewer_model import Issue, IssueType, Severity
+
+_EVAL_BUILTINS = frozenset({"eval", "exec"})
+_SQL_METHODS = frozenset({"execute", "executemany"})
+_MUTABLE_DEFAULTS = (ast.List, ast.Dict, ast.Set)
+
+
+def _is_string_formatting(node: ast.expr) -> bool:
+    if isinstance(node, ast.JoinedStr):
+        return True
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Mod)):
+        return any(
+            isinstance(side, ast.JoinedStr)
+            or (isinstance(side, ast.Constant) and isinstance(side.value, str))
+            for side in (node.left, node.right)
+        )
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        target = node.func.value
+        return (
+            node.func.attr == "format"
+            and isinstance(target, ast.Constant)
+            and isinstance(target.value, str)
+        )
+    return False
+
+
+class _RuleVisitor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.issues: list[Issue] = []
+        self._formatted_names: set[str] = set()
+
+    def _add(
+        self,
+        node: ast.expr | ast.stmt | ast.excepthandler,
+        issue_type: IssueType,
+        severity: Severity,
+        rule_id: str,
+        message: str,
+        suggestion: str,
+    ) -> None:
+        self.issues.append(Issue(
+            type=issue_type,
+            severity=severity,
+            line=node.lineno,
+            end_line=getattr(node, "end_lineno", None),
+            column=node.col_offset,
+            message=message,
+            suggestion=suggestion,
+            rule_id=rule_id,
+        ))
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+
+        if isinstance(func, ast.Name) and func.id in _EVAL_BUILTINS:
+            self._add(
+                node, IssueType.SECURITY, Severity.HIGH, "eval-call",
+                f"Use of {func.id}() can execute arbitrary code",
+                "Parse the input explicitly, e.g. with ast.literal_eval for literals",
+            )
+
+        elif (
+            isinstance(func, ast.Attribute)
+            and func.attr in ("loads", "load")
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "pickle"
+        ):
+            self._add(
+                node, IssueType.SECURITY, Severity.HIGH, "pickle-load",
+                f"pickle.{func.attr}() on untrusted data can execute arbitrary code",
+                "Use a data-only format such as JSON for untrusted input",
+            )
+
+        elif (
+            isinstance(func, ast.Attribute)
+            and func.attr in _SQL_METHODS
+            and node.args
+            and self._is_formatted(node.args[0])
+        ):
+            self._add(
+                node, IssueType.SECURITY, Severity.CRITICAL, "sql-string-format",
+                "SQL query built with string formatting is open to injection",
+                "Pass user values as query parameters instead",
+            )
+
+        for keyword in node.keywords:
+            if (
+                keyword.arg == "shell"
+                and isinstance(keyword.value, ast.Constant)
+                and keyword.value.value is True
+            ):
+                self._add(
+                    node, IssueType.SECURITY, Severity.HIGH, "shell-true",
+                    "Subprocess call with shell=True is open to command injection",
+                    "Pass the command as an argument list without shell=True",
+                )
+
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # query = f"SELECT ... {value}"; cursor.execute(query) is the common form.
+        formatted = _is_string_formatting(node.value)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                if formatted:
+                    self._formatted_names.add(target.id)
+                else:
+                    self._formatted_names.discard(target.id)
+        self.generic_visit(node)
+
+    def _is_formatted(self, node: ast.expr) -> bool:
+        if isinstance(node, ast.Name):
+            return node.id in self._formatted_names
+        return _is_string_formatting(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        if node.type is None:
+            self._add(
+                node, IssueType.BEST_PRACTICE, Severity.MEDIUM, "bare-except",
+                "Bare except also catches KeyboardInterrupt and SystemExit",
+                "Catch a specific exception type, or at least Exception",
+            )
+        self.generic_visit(node)
+
+    def _check_defaults(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        defaults = [*node.args.defaults, *(d for d in node.args.kw_defaults if d is not None)]
+        for default in defaults:
+            if isinstance(default, _MUTABLE_DEFAULTS):
+                self._add(
+                    default, IssueType.BUG, Severity.MEDIUM, "mutable-default",
+                    f"Mutable default argument in {node.name}() is shared between calls",
+                    "Default to None and create the container inside the function",
+                )
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._check_defaults(node)
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._check_defaults(node)
+        self.generic_visit(node)
+
+
+class FastAnalyzer:
+    def analyze(self, code: str, language: str = "python") -> list[Issue]:
+        if language != "python":
+            return []
+
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            return []
+
+        visitor = _RuleVisitor()
+        visitor.visit(tree)
+        visitor.issues.sort(key=lambda issue: issue.line)
+        return visitor.issues
@@ -1,3 +1,4 @@
+from .cache import ResponseCache, make_cache_key
 from .code_utils import (
     count_complexity,
     detect_language,
@@ -14,4 +15,6 @@ __all__ = [
     "find_function_boundaries",
     "sanitize_code_for_display",
     "get_line_content",
+    "ResponseCache",
+    "make_cache_key",
 ]
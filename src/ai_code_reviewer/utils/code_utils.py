@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
     from ..parsers.diff_parser import DiffHunk
@@ -86,6 +92,26 @@ LANGUAGE_PATTERNS = {
     ],
 }
 
+# A MULTILINE "^" is tested at every character, so "^\s*def" scans slowly.
+# Line-anchored patterns are rewritten to start with a literal "\n" and run
+# against the code with indentation stripped, which lets the regex engine
+# jump between candidate lines. Shared patterns (e.g. C and C++ includes)
+# are searched once.
+_LINE_START = r"^\s*"
+
+
+def _compile_pattern(pattern: str) -> tuple[re.Pattern[str], bool]:
+    if pattern.startswith(_LINE_START):
+        return re.compile("\n" + pattern[len(_LINE_START):]), True
+    return re.compile(pattern, re.MULTILINE), False
+
+
+_COMPILED_PATTERNS = {
+    pattern: _compile_pattern(pattern)
+    for patterns in LANGUAGE_PATTERNS.values()
+    for pattern in patterns
+}
+
 EXTENSION_MAP = {
     '.py': 'python',
     '.pyw': 'python',
@@ -129,18 +155,83 @@ EXTENSION_MAP = {
 }
 
 
+_COMPLEXITY_KEYWORDS = {
+    'python': ['if', 'elif', 'for', 'while', 'except', 'and', 'or'],
+    'javascript': ['if', 'else if', 'for', 'while', 'catch', '&&', '||', '?'],
+    'typescript': ['if', 'else if', 'for', 'while', 'catch', '&&', '||', '?'],
+    'java': ['if', 'else if', 'for', 'while', 'catch', '&&', '||', '?', 'case'],
+    'go': ['if', 'for', 'case', '&&', '||'],
+    'rust': ['if', 'else if', 'for', 'while', 'match', '&&', '||'],
+}
+
+
+def _complexity_matcher(keywords: list[str]) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    # Whole words never overlap, so one alternation counts them all in a
+    # single scan. Everything else ("else if", "&&") keeps str.count's
+    # independent, non-overlapping counting.
+    words = [k for k in keywords if k.isalpha()]
+    pattern = re.compile(rf"\b(?:{'|'.join(map(re.escape, words))})\b")
+    return pattern, tuple(k for k in keywords if not k.isalpha())
+
+
+_COMPLEXITY_MATCHERS = {
+    language: _complexity_matcher(keywords)
+    for language, keywords in _COMPLEXITY_KEYWORDS.items()
+}
+
+
+# Results are keyed on a digest of the source rather than the text itself,
+# so the caches never keep whole files alive.
+_DIGEST_CACHE_SIZE = 128
+_DIGEST_CACHE_LOCK = threading.Lock()
+_LANGUAGE_BY_DIGEST: OrderedDict[Hashable, str] = OrderedDict()
+_COMPLEXITY_BY_DIGEST: OrderedDict[Hashable, int] = OrderedDict()
+
+_T = TypeVar("_T")
+
+
+def _source_digest(code: str) -> bytes:
+    return hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _memoized(cache: OrderedDict[Hashable, _T], key: Hashable, compute: Callable[[], _T]) -> _T:
+    with _DIGEST_CACHE_LOCK:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+    value = compute()
+    with _DIGEST_CACHE_LOCK:
+        cache[key] = value
+        if len(cache) > _DIGEST_CACHE_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
 def detect_language(code: str, filename: str | None = None) -> str:
     if filename:
         ext = Path(filename).suffix.lower()
         if ext in EXTENSION_MAP:
             return EXTENSION_MAP[ext]
 
-    scores: dict[str, int] = dict.fromkeys(LANGUAGE_PATTERNS, 0)
+    return _detect_language_from_code(code)
 
-    for lang, patterns in LANGUAGE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, code, re.MULTILINE):
-                scores[lang] += 1
+
+def _detect_language_from_code(code: str) -> str:
+    return _memoized(_LANGUAGE_BY_DIGEST, _source_digest(code), lambda: _score_languages(code))
+
+
+def _score_languages(code: str) -> str:
+    stripped = "\n" + "\n".join(line.lstrip() for line in code.split("\n"))
+    found = {
+        pattern
+        for pattern, (regex, line_start) in _COMPILED_PATTERNS.items()
+        if regex.search(stripped if line_start else code)
+    }
+    scores = {
+        lang: sum(pattern in found for pattern in patterns)
+        for lang, patterns in LANGUAGE_PATTERNS.items()
+    }
 
     if max(scores.values()) > 0:
         return max(scores, key=lambda k: scores[k])
@@ -175,83 +266,105 @@ def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     if not ranges:
         return []
 
-    sorted_ranges = sorted(ranges, key=lambda x: x[0])
-    merged = [sorted_ranges[0]]
+    sorted_ranges = sorted(ranges, key=itemgetter(0))
+    merged = []
+    last_start, last_end = sorted_ranges[0]
 
-    for start, end in sorted_ranges[1:]:
-        last_start, last_end = merged[-1]
+    for start, end in islice(sorted_ranges, 1, None):
         if start <= last_end:
-            merged[-1] = (last_start, max(last_end, end))
+            if end > last_end:
+                last_end = end
         else:
-            merged.append((start, end))
+            merged.append((last_start, last_end))
+            last_start, last_end = start, end
 
+    merged.append((last_start, last_end))
     return merged
 
 
 def count_complexity(code: str, language: str) -> int:
-    complexity_keywords = {
-        'python': ['if', 'elif', 'for', 'while', 'except', 'and', 'or'],
-        'javascript': ['if', 'else if', 'for', 'while', 'catch', '&&', '||', '?'],
-        'typescript': ['if', 'else if', 'for', 'while', 'catch', '&&', '||', '?'],
-        'java': ['if', 'else if', 'for', 'while', 'catch', '&&', '||', '?', 'case'],
-        'go': ['if', 'for', 'case', '&&', '||'],
-        'rust': ['if', 'else if', 'for', 'while', 'match', '&&', '||'],
-    }
+    return _memoized(
+        _COMPLEXITY_BY_DIGEST,
+        (_source_digest(code), language),
+        lambda: _count_complexity(code, language),
+    )
 
-    keywords = complexity_keywords.get(language, complexity_keywords['python'])
-    complexity = 1
 
-    for keyword in keywords:
-        if keyword.isalpha():
-            complexity += len(re.findall(rf'\b{keyword}\b', code))
-        else:
-            complexity += code.count(keyword)
+def _count_complexity(code: str, language: str) -> int:
+    word_pattern, symbols = _COMPLEXITY_MATCHERS.get(language, _COMPLEXITY_MATCHERS['python'])
+    complexity = 1 + len(word_pattern.findall(code))
+
+    for symbol in symbols:
+        complexity += code.count(symbol)
 
     return complexity
 
 
-def find_function_boundaries(code: str, language: str) -> list[dict]:
-    patterns = {
-        'python': r'^\s*def\s+(\w+)\s*\(',
-        'javascript': r'(?:function\s+(\w+)|(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))',
-        'typescript': r'(?:function\s+(\w+)|(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))',
-        'java': r'(?:public|private|protected)?\s*(?:static)?\s*\w+\s+(\w+)\s*\(',
-        'go': r'func\s+(?:\([^)]+\)\s+)?(\w+)\s*\(',
-        'rust': r'fn\s+(\w+)\s*[<(]',
-    }
+_FUNCTION_PATTERNS = {
+    'python': r'^\s*def\s+(\w+)\s*\(',
+    'javascript': r'(?:function\s+(\w+)|(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))',
+    'typescript': r'(?:function\s+(\w+)|(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))',
+    'java': r'(?:public|private|protected)?\s*(?:static)?\s*\w+\s+(\w+)\s*\(',
+    'go': r'func\s+(?:\([^)]+\)\s+)?(\w+)\s*\(',
+    'rust': r'fn\s+(\w+)\s*[<(]',
+}
 
-    pattern = patterns.get(language)
-    if not pattern:
+
+def _single_line(pattern: str) -> re.Pattern[str]:
+    # Scanning the whole text at once must not let a match run onto the next
+    # line, so whitespace and [^)] are kept from consuming newlines.
+    return re.compile(
+        pattern.replace(r'\s', r'[^\S\n]').replace('[^)]', '[^)\n]'),
+        re.MULTILINE,
+    )
+
+
+_FUNCTION_REGEXES = {
+    language: _single_line(pattern)
+    for language, pattern in _FUNCTION_PATTERNS.items()
+}
+
+
+def find_function_boundaries(code: str, language: str) -> list[dict]:
+    regex = _FUNCTION_REGEXES.get(language)
+    if not regex:
         return []
 
     functions = []
-    lines = code.split('\n')
-
-    for i, line in enumerate(lines):
-        match = re.search(pattern, line)
-        if match:
-            name = next((g for g in match.groups() if g), "anonymous")
-            functions.append({
-                'name': name,
-                'start_line': i + 1,
-                'end_line': None,
-            })
+    line = 1
+    last_line = 0
+    pos = 0
+
+    for match in regex.finditer(code):
+        line += code.count('\n', pos, match.start())
+        pos = match.start()
+        if line == last_line:
+            continue
+        last_line = line
+
+        name = next((g for g in match.groups() if g), "anonymous")
+        functions.append({
+            'name': name,
+            'start_line': line,
+            'end_line': None,
+        })
 
     return functions
 
 
 def sanitize_code_for_display(code: str, max_length: int = 5000) -> str:
-    sanitized = code.replace('\x00', '')
-
-    if len(sanitized) > max_length:
-        half = max_length // 2 - 50
-        sanitized = (
-            sanitized[:half] +
-            f"\n\n... ({len(code) - max_length} characters truncated) ...\n\n" +
-            sanitized[-half:]
-        )
-
-    return sanitized
+    # The membership test is one C scan; replace() would always copy.
+    sanitized = code.replace('\x00', '') if '\x00' in code else code
+
+    if len(sanitized) <= max_length:
+        return sanitized
+
+    half = max_length // 2 - 50
+    return "".join((
+        sanitized[:half],
+        f"\n\n... ({len(code) - max_length} characters truncated) ...\n\n",
+        sanitized[-half:],
+    ))
 
 
 def get_line_content(code: str, line_number: int) -> str:
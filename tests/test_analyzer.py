@@ -2,10 +2,15 @@
 Tests for the AI Code Reviewer analyzer module.
 """
 
-from unittest.mock import MagicMock, patch
+import dataclasses
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from openai import OpenAI
 
+from ai_code_reviewer import analyzer
 from ai_code_reviewer.analyzer import CodeReviewer, ReviewConfig, ReviewMode
 from ai_code_reviewer.models import (
     Issue,
@@ -16,6 +21,94 @@ from ai_code_reviewer.models import (
     Severity,
 )
 
+CONFIG_CONTENT = """
+model:
+  provider: "anthropic"
+  name: "claude-3-sonnet"
+  temperature: 0.2
+review:
+  severity_threshold: "high"
+  max_comments: 5
+  include_positive: false
+rules:
+  python:
+    check_types: true
+"""
+
+CANNED_RESPONSE_JSON = json.dumps({
+    "issues": [
+        {
+            "type": "bug",
+            "severity": "high",
+            "line": 5,
+            "message": "Potential division by zero",
+            "suggestion": "Add a check for empty list",
+        }
+    ],
+    "positive_feedback": ["Good function naming"],
+})
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the response cache out of the user's home directory."""
+    monkeypatch.setenv("AI_REVIEW_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def empty_client_pool():
+    """Drop pooled SDK clients so each test sees its own mocks."""
+    analyzer._CLIENT_POOL.clear()
+    yield
+    analyzer._CLIENT_POOL.clear()
+
+
+@pytest.fixture(scope="session")
+def yaml_config_file(tmp_path_factory):
+    """Write the sample YAML config once per session."""
+    path = tmp_path_factory.mktemp("cfg") / ".ai-review.yml"
+    path.write_text(CONFIG_CONTENT)
+    return path
+
+
+@pytest.fixture(scope="session")
+def py_file(tmp_path_factory):
+    """Write a small Python source file once per session."""
+    path = tmp_path_factory.mktemp("src") / "test.py"
+    path.write_text("def foo(): pass")
+    return path
+
+
+@pytest.fixture(scope="class")
+def openai_api_key():
+    """Provide an OpenAI key for the duration of a test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "test-key")
+        yield
+
+
+@pytest.fixture(scope="module")
+def openai_client_patch():
+    """Patch openai.OpenAI once per module and hand out the shared mock client."""
+    with patch("openai.OpenAI") as mock:
+        client = MagicMock(spec=OpenAI)
+        mock.return_value = client
+
+        # Mock response
+        message = SimpleNamespace(content=CANNED_RESPONSE_JSON)
+        response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        client.chat.completions.create = Mock(return_value=response)
+
+        yield client, response
+
+
+def make_issues(*specs):
+    """Build fresh Issue instances from (type, severity, message), numbering lines from 1."""
+    return [
+        Issue(issue_type, severity, line, message)
+        for line, (issue_type, severity, message) in enumerate(specs, start=1)
+    ]
+
 
 class TestReviewConfig:
     """Tests for ReviewConfig."""
@@ -44,25 +137,19 @@ class TestReviewConfig:
         assert config.model == "claude-3-opus"
         assert config.mode == ReviewMode.DEEP
 
-    def test_config_from_file(self, tmp_path):
-        """Test loading config from YAML file."""
-        config_content = """
-model:
-  provider: "anthropic"
-  name: "claude-3-sonnet"
-  temperature: 0.2
-review:
-  severity_threshold: "high"
-  max_comments: 5
-  include_positive: false
-rules:
-  python:
-    check_types: true
-"""
-        config_file = tmp_path / ".ai-review.yml"
-        config_file.write_text(config_content)
+    def test_config_is_frozen(self):
+        """Test configs are read-only and share the empty rules mapping."""
+        config = ReviewConfig()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.model = "gpt-3.5-turbo"
+
+        assert config.language_rules is ReviewConfig().language_rules
+        assert dataclasses.replace(config, model="gpt-3.5-turbo").model == "gpt-3.5-turbo"
 
-        config = ReviewConfig.from_file(config_file)
+    def test_config_from_file(self, yaml_config_file):
+        """Test loading config from YAML file."""
+        config = ReviewConfig.from_file(yaml_config_file)
 
         assert config.provider == LLMProvider.ANTHROPIC
         assert config.model == "claude-3-sonnet"
@@ -72,34 +159,31 @@ rules:
         assert config.include_positive_feedback is False
 
 
+@pytest.mark.xdist_group("openai-mock")
+@pytest.mark.usefixtures("openai_api_key")
 class TestCodeReviewer:
     """Tests for CodeReviewer."""
 
     @pytest.fixture
-    def mock_openai_client(self):
-        """Create a mock OpenAI client."""
-        with patch("openai.OpenAI") as mock:
+    def mock_openai_client(self, openai_client_patch):
+        """Reset the shared mock OpenAI client to the canned response."""
+        client, response = openai_client_patch
+        client.reset_mock(return_value=False, side_effect=True)
+        client.chat.completions.create.return_value = response
+
+        return client
+
+    @pytest.fixture
+    def mock_async_openai_client(self):
+        """Create a mock AsyncOpenAI client."""
+        with patch("openai.AsyncOpenAI") as mock:
             client = MagicMock()
+            client.__aenter__.return_value = client
             mock.return_value = client
 
-            # Mock response
-            response = MagicMock()
-            response.choices = [MagicMock()]
-            response.choices[0].message.content = '''
-{
-    "issues": [
-        {
-            "type": "bug",
-            "severity": "high",
-            "line": 5,
-            "message": "Potential division by zero",
-            "suggestion": "Add a check for empty list"
-        }
-    ],
-    "positive_feedback": ["Good function naming"]
-}
-'''
-            client.chat.completions.create.return_value = response
+            message = SimpleNamespace(content='{"issues": [], "positive_feedback": []}')
+            response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+            client.chat.completions.create = AsyncMock(return_value=response)
 
             yield client
 
@@ -117,7 +201,6 @@ class TestCodeReviewer:
 
         assert reviewer.config.model == "gpt-3.5-turbo"
 
-    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
     def test_api_key_from_env(self):
         """Test API key is read from environment."""
         reviewer = CodeReviewer()
@@ -125,10 +208,9 @@ class TestCodeReviewer:
 
     def test_review_basic(self, mock_openai_client):
         """Test basic code review."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            reviewer = CodeReviewer()
+        reviewer = CodeReviewer()
 
-            code = """
+        code = """
 def calculate_average(numbers):
     total = 0
     for n in numbers:
@@ -136,31 +218,304 @@ def calculate_average(numbers):
     return total / len(numbers)
 """
 
-            result = reviewer.review(code, language="python")
+        result = reviewer.review(code, language="python")
 
-            assert isinstance(result, ReviewResult)
-            assert len(result.issues) == 1
-            assert result.issues[0].type == IssueType.BUG
-            assert result.issues[0].severity == Severity.HIGH
+        assert isinstance(result, ReviewResult)
+        assert len(result.issues) == 1
+        assert result.issues[0].type == IssueType.BUG
+        assert result.issues[0].severity == Severity.HIGH
 
-    def test_review_file(self, mock_openai_client, tmp_path):
-        """Test reviewing a file."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            # Create a test file
-            test_file = tmp_path / "test.py"
-            test_file.write_text("def foo(): pass")
+    def test_quick_review_uses_static_findings(self, mock_openai_client):
+        """Test QUICK mode returns static findings without calling the LLM."""
+        reviewer = CodeReviewer(ReviewConfig(mode=ReviewMode.QUICK))
+
+        result = reviewer.review("eval(x)\n", language="python")
+
+        assert [i.rule_id for i in result.issues] == ["eval-call"]
+        assert result.summary.security_issues == 1
+        mock_openai_client.chat.completions.create.assert_not_called()
+
+    def test_review_merges_static_findings(self, mock_openai_client):
+        """Test static findings are merged with LLM issues, deduped by line and type."""
+        code = "x = 1\n\n\n\nimport pickle; pickle.loads(eval(y))\n"
+
+        reviewer = CodeReviewer()
+        result = reviewer.review(code, language="python")
+
+        # The LLM reports a bug on line 5; both static findings are security issues,
+        # pickle-load and eval-call share (line, type), so only one is added.
+        assert [(i.line, i.type) for i in result.issues] == [
+            (5, IssueType.BUG),
+            (5, IssueType.SECURITY),
+        ]
+        assert result.summary.total_issues == 2
+
+    def test_review_mode_override(self, mock_openai_client):
+        """Test per-call mode does not mutate the shared config."""
+        reviewer = CodeReviewer()
+
+        with patch.object(
+            reviewer.prompt_builder,
+            "build_review_prompt",
+            wraps=reviewer.prompt_builder.build_review_prompt,
+        ) as build:
+            reviewer.review("x = 1", language="python", mode=ReviewMode.DEEP)
 
-            reviewer = CodeReviewer()
-            result = reviewer.review_file(test_file)
+        assert build.call_args.kwargs["mode"] == ReviewMode.DEEP
+        assert reviewer.config.mode == ReviewMode.STANDARD
 
-            assert isinstance(result, ReviewResult)
+    def test_review_uses_response_cache(self, mock_openai_client):
+        """Test identical prompts are answered from the response cache."""
+        reviewer = CodeReviewer(cache=True)
 
-    def test_review_file_not_found(self):
+        first = reviewer.review("x = 1", language="python")
+        second = CodeReviewer(cache=True).review("x = 1", language="python")
+
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert second.issues[0].message == first.issues[0].message
+
+    def test_unparseable_response_not_cached(self, mock_openai_client):
+        """Test truncated responses are not replayed from the cache."""
+        message = SimpleNamespace(content='{"issues": [{"type": "bug"')
+        mock_openai_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=message)]
+        )
+
+        CodeReviewer(cache=True).review("x = 1", language="python")
+        CodeReviewer(cache=True).review("x = 1", language="python")
+
+        assert mock_openai_client.chat.completions.create.call_count == 2
+
+    def test_cache_key_includes_endpoint(self, monkeypatch):
+        """Test two local servers never share cached responses."""
+        config = ReviewConfig(provider=LLMProvider.LOCAL, model="llama")
+        monkeypatch.setenv("LOCAL_LLM_URL", "http://a:11434/v1")
+        first = CodeReviewer(config)._cache_key("x = 1")
+        monkeypatch.setenv("LOCAL_LLM_URL", "http://b:11434/v1")
+        second = CodeReviewer(config)._cache_key("x = 1")
+
+        assert first != second
+
+    def test_review_without_cache(self, mock_openai_client):
+        """Test the response cache is off unless asked for."""
+        reviewer = CodeReviewer()
+
+        reviewer.review("x = 1", language="python")
+        reviewer.review("x = 1", language="python")
+
+        assert reviewer.cache is None
+        assert mock_openai_client.chat.completions.create.call_count == 2
+
+    def test_review_diff_concurrent(self, mock_async_openai_client):
+        """Test each file in a diff gets its own result, in diff order."""
+        diff = "".join(
+            f"""diff --git a/{name} b/{name}
+--- a/{name}
++++ b/{name}
+@@ -1,1 +1,2 @@
+ x = 1
++y = 2
+"""
+            for name in ("a.py", "b.py", "c.py")
+        )
+
+        reviewer = CodeReviewer(ReviewConfig(max_concurrency=2, batch_small_files=False))
+        results = reviewer.review_diff(diff)
+
+        assert [r.file_path for r in results] == ["a.py", "b.py", "c.py"]
+        assert mock_async_openai_client.chat.completions.create.await_count == 3
+
+    def test_review_diff_batches_small_files(self, mock_async_openai_client):
+        """Test small files in a diff share one multi-file request."""
+        diff = "".join(
+            f"""diff --git a/{name} b/{name}
+--- a/{name}
++++ b/{name}
+@@ -1,1 +1,2 @@
+ x = 1
++y = 2
+"""
+            for name in ("a.py", "b.py")
+        )
+        response = mock_async_openai_client.chat.completions.create.return_value
+        response.choices[0].message.content = json.dumps({"files": [
+            {"file": "b.py", "issues": [], "positive_feedback": ["Tidy"]},
+            {"file": "a.py", "issues": [{
+                "type": "bug", "severity": "high", "line": 2, "message": "Unused",
+            }], "positive_feedback": []},
+        ]})
+
+        results = CodeReviewer().review_diff(diff)
+
+        assert [r.file_path for r in results] == ["a.py", "b.py"]
+        assert results[0].issues[0].message == "Unused"
+        assert results[1].positive_feedback == ["Tidy"]
+        assert mock_async_openai_client.chat.completions.create.await_count == 1
+
+    def test_review_diff_batch_fallback(self, mock_async_openai_client):
+        """Test files missing from a batched response are reviewed one by one."""
+        diff = "".join(
+            f"""diff --git a/{name} b/{name}
+--- a/{name}
++++ b/{name}
+@@ -1,1 +1,2 @@
+ x = 1
++y = 2
+"""
+            for name in ("a.py", "b.py")
+        )
+
+        results = CodeReviewer().review_diff(diff)
+
+        assert [r.file_path for r in results] == ["a.py", "b.py"]
+        assert mock_async_openai_client.chat.completions.create.await_count == 3
+
+    async def test_areview_files(self, mock_async_openai_client, tmp_path):
+        """Test a missing file yields None without sinking the other reviews."""
+        path = tmp_path / "risky.py"
+        path.write_text("eval(data)\n")
+
+        results = await CodeReviewer().areview_files([tmp_path / "missing.py", path])
+
+        assert results[0] is None
+        assert [issue.rule_id for issue in results[1].issues] == ["eval-call"]
+        assert mock_async_openai_client.chat.completions.create.await_count == 1
+
+    async def test_review_diff_inside_running_loop(self, mock_async_openai_client):
+        """Test the sync review_diff also works when called from async code."""
+        diff = "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1,1 +1,2 @@\n x = 1\n+y = 2\n"
+
+        results = CodeReviewer().review_diff(diff)
+
+        assert [r.file_path for r in results] == ["a.py"]
+
+    def test_review_stream(self, mock_openai_client):
+        """Test streamed chunks are yielded and then served from the cache."""
+        chunks = []
+        for text in ('{"issues": [], ', '"positive_feedback": ["Nice"]}'):
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = text
+            chunks.append(chunk)
+        mock_openai_client.chat.completions.create.return_value = iter(chunks)
+
+        reviewer = CodeReviewer(cache=True)
+
+        streamed = list(reviewer.review_stream("x = 1", language="python"))
+        result = reviewer.review("x = 1", language="python")
+
+        assert "".join(streamed) == '{"issues": [], "positive_feedback": ["Nice"]}'
+        assert result.positive_feedback == ["Nice"]
+        assert mock_openai_client.chat.completions.create.call_count == 1
+
+    def test_review_stream_quick_mode_skips_llm(self, mock_openai_client):
+        """Test quick mode streams static findings without calling the model."""
+        reviewer = CodeReviewer()
+
+        text = "".join(reviewer.review_stream("eval(data)\n", language="python", mode=ReviewMode.QUICK))
+        result = reviewer.result_from_stream(text, "eval(data)\n", language="python")
+
+        assert [issue.rule_id for issue in result.issues] == ["eval-call"]
+        assert mock_openai_client.chat.completions.create.call_count == 0
+
+    def test_result_from_stream_merges_static_issues(self):
+        """Test streamed responses get the same static findings as review()."""
+        reviewer = CodeReviewer()
+
+        result = reviewer.result_from_stream(CANNED_RESPONSE_JSON, "eval(data)\n", language="python")
+
+        assert "eval-call" in [issue.rule_id for issue in result.issues]
+
+    def test_parse_response_with_fence_in_string(self):
+        """Test fenced JSON whose strings contain their own code fences."""
+        reviewer = CodeReviewer(cache=False)
+        response = (
+            "Here is the review:\n```json\n"
+            '{"issues": [{"type": "style", "severity": "low", "line": 1, '
+            '"message": "Use ```black```", "code_suggestion": "x = {1: 2}"}], '
+            '"positive_feedback": []}\n```\nThanks!'
+        )
+
+        result = reviewer._parse_review_response(response, "x={1:2}", "python")
+
+        assert len(result.issues) == 1
+        assert result.issues[0].message == "Use ```black```"
+        assert result.issues[0].code_suggestion == "x = {1: 2}"
+
+    def test_parse_response_not_json(self):
+        """Test non-JSON responses are kept as raw feedback."""
+        reviewer = CodeReviewer(cache=False)
+
+        result = reviewer._parse_review_response("Looks fine {but no json", "", "python")
+
+        assert result.issues == []
+        assert result.summary.raw_feedback == "Looks fine {but no json"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_extract_json_trailing_text(self, use_orjson):
+        """Test JSON followed by stray braces parses with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+
+        with patch.object(analyzer, "_HAS_ORJSON", use_orjson):
+            data = analyzer._extract_json('{"issues": [], "note": "}"} see {above}')
+
+        assert data == {"issues": [], "note": "}"}
+
+    def test_anthropic_system_prompt_cacheable(self):
+        """Test the Anthropic system prompt is sent as a cache_control block."""
+        with patch("anthropic.Anthropic") as mock:
+            client = MagicMock()
+            client.messages.create.return_value.content = [MagicMock(text='{"issues": []}')]
+            mock.return_value = client
+
+            reviewer = CodeReviewer(
+                ReviewConfig(provider=LLMProvider.ANTHROPIC),
+                api_key="test-key",
+                cache=False,
+            )
+            reviewer.review("x = 1", language="python")
+
+        system = client.messages.create.call_args.kwargs["system"]
+        assert system[0]["text"] == reviewer.prompt_builder.system_prompt
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_client_pooled_across_reviewers(self, mock_openai_client):
+        """Test reviewers with the same provider and key share one client."""
+        first = CodeReviewer(api_key="key-a")
+        second = CodeReviewer(api_key="key-a")
+        other = CodeReviewer(api_key="key-b")
+
+        assert first.client is second.client
+        assert len(analyzer._CLIENT_POOL) == 1
+
+        other_client = other.client
+        assert len(analyzer._CLIENT_POOL) == 2
+        assert analyzer._CLIENT_POOL[("openai", "key-b", None)] is other_client
+        assert analyzer._CLIENT_POOL[("openai", "key-a", None)] is first.client
+
+    def test_review_file(self, mock_openai_client, py_file):
+        """Test reviewing a file."""
+        reviewer = CodeReviewer()
+        result = reviewer.review_file(py_file)
+
+        assert isinstance(result, ReviewResult)
+
+    def test_review_file_not_found(self, tmp_path):
         """Test error when file not found."""
         reviewer = CodeReviewer()
 
-        with pytest.raises(FileNotFoundError):
-            reviewer.review_file("/nonexistent/file.py")
+        with pytest.raises(FileNotFoundError, match="missing.py"):
+            reviewer.review_file(tmp_path / "missing.py")
+
+    def test_review_file_too_large(self, tmp_path):
+        """Test files over max_file_bytes are rejected before any LLM call."""
+        test_file = tmp_path / "generated.py"
+        test_file.write_text("x = 1\n" * 100)
+
+        reviewer = CodeReviewer(ReviewConfig(max_file_bytes=64))
+
+        with pytest.raises(ValueError, match="too large"):
+            reviewer.review_file(test_file)
 
     def test_repr(self):
         """Test string representation."""
@@ -220,12 +575,45 @@ class TestIssue:
         assert data["severity"] == "medium"
         assert data["line"] == 20
 
+    def test_issue_dict_round_trip(self):
+        """Test every field survives from_dict followed by to_dict."""
+        data = {
+            "type": "performance",
+            "severity": "low",
+            "line": 7,
+            "end_line": 9,
+            "column": 4,
+            "message": "Quadratic loop",
+            "suggestion": "Use a set",
+            "code_suggestion": "seen = set()",
+            "rule_id": "perf-001",
+        }
+
+        assert Issue.from_dict(data).to_dict() == data
+
     def test_severity_comparison(self):
         """Test severity comparison."""
         assert Severity.LOW < Severity.MEDIUM
         assert Severity.MEDIUM < Severity.HIGH
         assert Severity.HIGH < Severity.CRITICAL
 
+    def test_severity_ordering_not_alphabetical(self):
+        """Test every comparison operator follows severity rank, not the string value."""
+        assert not Severity.LOW > Severity.HIGH
+        assert Severity.CRITICAL > Severity.LOW
+        assert Severity.MEDIUM >= Severity.MEDIUM
+        assert Severity.HIGH <= Severity.CRITICAL
+        assert max(Severity) == Severity.CRITICAL
+        assert Severity("high") is Severity.HIGH
+
+    def test_severity_comparison_with_non_member(self):
+        """Test ordering against a non-Severity raises TypeError, not KeyError."""
+        with pytest.raises(TypeError):
+            Severity.LOW < 1  # noqa: B015
+
+        with pytest.raises(TypeError):
+            Severity.HIGH >= None  # noqa: B015
+
     def test_issue_format(self):
         """Test issue formatting."""
         issue = Issue(
@@ -248,10 +636,10 @@ class TestReviewResult:
 
     def test_result_creation(self):
         """Test creating a ReviewResult."""
-        issues = [
-            Issue(IssueType.BUG, Severity.HIGH, 1, "Bug 1"),
-            Issue(IssueType.STYLE, Severity.LOW, 2, "Style 1"),
-        ]
+        issues = make_issues(
+            (IssueType.BUG, Severity.HIGH, "Bug 1"),
+            (IssueType.STYLE, Severity.LOW, "Style 1"),
+        )
 
         result = ReviewResult(
             code="test code",
@@ -265,11 +653,11 @@ class TestReviewResult:
 
     def test_filter_by_severity(self):
         """Test filtering issues by severity."""
-        issues = [
-            Issue(IssueType.BUG, Severity.LOW, 1, "Low"),
-            Issue(IssueType.BUG, Severity.HIGH, 2, "High"),
-            Issue(IssueType.BUG, Severity.CRITICAL, 3, "Critical"),
-        ]
+        issues = make_issues(
+            (IssueType.BUG, Severity.LOW, "Low"),
+            (IssueType.BUG, Severity.HIGH, "High"),
+            (IssueType.BUG, Severity.CRITICAL, "Critical"),
+        )
 
         result = ReviewResult(
             code="",
@@ -284,11 +672,11 @@ class TestReviewResult:
 
     def test_filter_by_type(self):
         """Test filtering issues by type."""
-        issues = [
-            Issue(IssueType.BUG, Severity.HIGH, 1, "Bug"),
-            Issue(IssueType.SECURITY, Severity.HIGH, 2, "Security"),
-            Issue(IssueType.BUG, Severity.LOW, 3, "Bug 2"),
-        ]
+        issues = make_issues(
+            (IssueType.BUG, Severity.HIGH, "Bug"),
+            (IssueType.SECURITY, Severity.HIGH, "Security"),
+            (IssueType.BUG, Severity.LOW, "Bug 2"),
+        )
 
         result = ReviewResult(
             code="",
@@ -321,12 +709,12 @@ class TestReviewSummary:
 
     def test_summary_from_issues(self):
         """Test creating summary from issues."""
-        issues = [
-            Issue(IssueType.BUG, Severity.HIGH, 1, "Bug"),
-            Issue(IssueType.BUG, Severity.LOW, 2, "Bug 2"),
-            Issue(IssueType.SECURITY, Severity.CRITICAL, 3, "Security"),
-            Issue(IssueType.STYLE, Severity.LOW, 4, "Style"),
-        ]
+        issues = make_issues(
+            (IssueType.BUG, Severity.HIGH, "Bug"),
+            (IssueType.BUG, Severity.LOW, "Bug 2"),
+            (IssueType.SECURITY, Severity.CRITICAL, "Security"),
+            (IssueType.STYLE, Severity.LOW, "Style"),
+        )
 
         summary = ReviewSummary.from_issues(issues)
 
@@ -2,6 +2,8 @@
 Tests for the diff parser module.
 """
 
+import sys
+
 import pytest
 
 from ai_code_reviewer.parsers.diff_parser import (
@@ -12,44 +14,80 @@ from ai_code_reviewer.parsers.diff_parser import (
     LineType,
 )
 
+SIMPLE_DIFF = """diff --git a/example.py b/example.py
+index 1234567..abcdefg 100644
+--- a/example.py
++++ b/example.py
+@@ -1,5 +1,7 @@
+ def hello():
+-    print("Hello")
++    print("Hello, World!")
++    return True
 
-class TestDiffLine:
-    """Tests for DiffLine."""
+ def main():
+     hello()
+"""
 
-    def test_context_line(self):
-        """Test context line creation."""
-        line = DiffLine(
-            content="unchanged code",
-            line_type=LineType.CONTEXT,
-            old_line_number=5,
-            new_line_number=5,
-        )
+MULTI_FILE_DIFF = """diff --git a/file1.py b/file1.py
+--- a/file1.py
++++ b/file1.py
+@@ -1,3 +1,4 @@
+ def foo():
++    # Added comment
+     pass
+diff --git a/file2.py b/file2.py
+--- a/file2.py
++++ b/file2.py
+@@ -1,2 +1,3 @@
+ def bar():
++    return 42
+     pass
+"""
 
-        assert line.content == "unchanged code"
-        assert line.line_type == LineType.CONTEXT
-        assert not line.is_changed
+NEW_FILE_DIFF = """diff --git a/newfile.py b/newfile.py
+new file mode 100644
+index 0000000..1234567
+--- /dev/null
++++ b/newfile.py
+@@ -0,0 +1,3 @@
++def new_function():
++    pass
++
+"""
 
-    def test_addition_line(self):
-        """Test addition line."""
-        line = DiffLine(
-            content="new code",
-            line_type=LineType.ADDITION,
-            new_line_number=10,
-        )
 
-        assert line.line_type == LineType.ADDITION
-        assert line.is_changed
+class TestDiffLine:
+    """Tests for DiffLine."""
 
-    def test_deletion_line(self):
-        """Test deletion line."""
+    @pytest.mark.parametrize(
+        "line_type,content,old_no,new_no,expected_is_changed",
+        [
+            (LineType.CONTEXT, "unchanged code", 5, 5, False),
+            (LineType.ADDITION, "new code", None, 10, True),
+            (LineType.DELETION, "old code", 10, None, True),
+        ],
+    )
+    def test_diff_line(self, line_type, content, old_no, new_no, expected_is_changed):
+        """Test line creation and change detection for each line type."""
         line = DiffLine(
-            content="old code",
-            line_type=LineType.DELETION,
-            old_line_number=10,
+            content=content,
+            line_type=line_type,
+            old_line_number=old_no,
+            new_line_number=new_no,
         )
 
-        assert line.line_type == LineType.DELETION
-        assert line.is_changed
+        assert line.content == content
+        assert line.line_type == line_type
+        assert line.old_line_number == old_no
+        assert line.new_line_number == new_no
+        assert line.is_changed is expected_is_changed
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+    def test_uses_slots(self):
+        """Test diff lines don't carry a per-instance __dict__."""
+        line = DiffLine("code", LineType.CONTEXT)
+
+        assert not hasattr(line, "__dict__")
 
 
 class TestDiffHunk:
@@ -69,33 +107,28 @@ class TestDiffHunk:
         assert hunk.new_start == 10
         assert hunk.new_count == 7
 
-    def test_hunk_additions(self):
-        """Test getting additions from hunk."""
+    @pytest.mark.parametrize(
+        "kind,line_type,expected_count",
+        [
+            ("additions", LineType.ADDITION, 2),
+            ("deletions", LineType.DELETION, 1),
+        ],
+    )
+    def test_hunk_filter(self, kind, line_type, expected_count):
+        """Test additions and deletions select only their own line type."""
         hunk = DiffHunk(1, 3, 1, 4)
         hunk.lines = [
             DiffLine(" context", LineType.CONTEXT),
             DiffLine("+added", LineType.ADDITION, new_line_number=2),
-            DiffLine("+added2", LineType.ADDITION, new_line_number=3),
-            DiffLine(" context", LineType.CONTEXT),
-        ]
-
-        additions = hunk.additions
-
-        assert len(additions) == 2
-        assert all(line.line_type == LineType.ADDITION for line in additions)
-
-    def test_hunk_deletions(self):
-        """Test getting deletions from hunk."""
-        hunk = DiffHunk(1, 3, 1, 2)
-        hunk.lines = [
-            DiffLine(" context", LineType.CONTEXT),
             DiffLine("-removed", LineType.DELETION, old_line_number=2),
+            DiffLine("+added2", LineType.ADDITION, new_line_number=3),
             DiffLine(" context", LineType.CONTEXT),
         ]
 
-        deletions = hunk.deletions
+        lines = getattr(hunk, kind)
 
-        assert len(deletions) == 1
+        assert len(lines) == expected_count
+        assert all(line.line_type == line_type for line in lines)
 
     def test_changed_new_lines(self):
         """Test getting changed line numbers."""
@@ -111,6 +144,20 @@ class TestDiffHunk:
 
         assert lines == [1, 2, 4]
 
+    def test_aggregates_follow_lines_until_finalized(self):
+        """Test aggregates track the lines until finalize() fixes them."""
+        hunk = DiffHunk(1, 1, 1, 2)
+        hunk.lines = [DiffLine("a", LineType.ADDITION, new_line_number=1)]
+        assert hunk.changed_new_lines == [1]
+
+        hunk.lines.append(DiffLine("b", LineType.ADDITION, new_line_number=2))
+        assert len(hunk.additions) == 2
+
+        hunk.finalize()
+
+        assert hunk.changed_new_lines == [1, 2]
+        assert hunk.additions is hunk.additions
+
     def test_get_context(self):
         """Test getting hunk context as string."""
         hunk = DiffHunk(1, 2, 1, 2)
@@ -178,60 +225,37 @@ class TestFileDiff:
 class TestDiffParser:
     """Tests for DiffParser."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
         """Create a parser instance."""
         return DiffParser()
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def simple_diff(self):
         """Simple diff for testing."""
-        return """diff --git a/example.py b/example.py
-index 1234567..abcdefg 100644
---- a/example.py
-+++ b/example.py
-@@ -1,5 +1,7 @@
- def hello():
--    print("Hello")
-+    print("Hello, World!")
-+    return True
+        return SIMPLE_DIFF
 
- def main():
-     hello()
-"""
+    @pytest.fixture(scope="session")
+    def parsed_simple(self, simple_diff):
+        """Simple diff parsed once and shared by read-only tests."""
+        return DiffParser().parse(simple_diff)
+
+    @pytest.fixture(scope="session")
+    def patch_file(self, tmp_path_factory, simple_diff):
+        """Simple diff written to disk once per session."""
+        path = tmp_path_factory.mktemp("diff") / "test.patch"
+        path.write_text(simple_diff)
+        return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def multi_file_diff(self):
         """Multi-file diff for testing."""
-        return """diff --git a/file1.py b/file1.py
---- a/file1.py
-+++ b/file1.py
-@@ -1,3 +1,4 @@
- def foo():
-+    # Added comment
-     pass
-diff --git a/file2.py b/file2.py
---- a/file2.py
-+++ b/file2.py
-@@ -1,2 +1,3 @@
- def bar():
-+    return 42
-     pass
-"""
+        return MULTI_FILE_DIFF
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def new_file_diff(self):
         """New file diff for testing."""
-        return """diff --git a/newfile.py b/newfile.py
-new file mode 100644
-index 0000000..1234567
---- /dev/null
-+++ b/newfile.py
-@@ -0,0 +1,3 @@
-+def new_function():
-+    pass
-+
-"""
+        return NEW_FILE_DIFF
 
     def test_parse_simple_diff(self, parser, simple_diff):
         """Test parsing a simple diff."""
@@ -241,30 +265,27 @@ index 0000000..1234567
         assert result[0].file_path == "example.py"
         assert len(result[0].hunks) == 1
 
-    def test_parse_hunk_header(self, parser, simple_diff):
+    def test_parse_hunk_header(self, parsed_simple):
         """Test parsing hunk header."""
-        result = parser.parse(simple_diff)
-        hunk = result[0].hunks[0]
+        hunk = parsed_simple[0].hunks[0]
 
         assert hunk.old_start == 1
         assert hunk.old_count == 5
         assert hunk.new_start == 1
         assert hunk.new_count == 7
 
-    def test_parse_additions(self, parser, simple_diff):
+    def test_parse_additions(self, parsed_simple):
         """Test parsing additions."""
-        result = parser.parse(simple_diff)
-        hunk = result[0].hunks[0]
+        hunk = parsed_simple[0].hunks[0]
 
         additions = hunk.additions
 
         assert len(additions) == 2
         assert 'print("Hello, World!")' in additions[0].content
 
-    def test_parse_deletions(self, parser, simple_diff):
+    def test_parse_deletions(self, parsed_simple):
         """Test parsing deletions."""
-        result = parser.parse(simple_diff)
-        hunk = result[0].hunks[0]
+        hunk = parsed_simple[0].hunks[0]
 
         deletions = hunk.deletions
 
@@ -293,10 +314,9 @@ index 0000000..1234567
 
         assert len(result) == 0
 
-    def test_line_numbers(self, parser, simple_diff):
+    def test_line_numbers(self, parsed_simple):
         """Test line numbers are correctly assigned."""
-        result = parser.parse(simple_diff)
-        hunk = result[0].hunks[0]
+        hunk = parsed_simple[0].hunks[0]
 
         # Check that additions have new line numbers
         for line in hunk.additions:
@@ -306,12 +326,9 @@ index 0000000..1234567
         for line in hunk.deletions:
             assert line.old_line_number is not None
 
-    def test_parse_file(self, parser, tmp_path, simple_diff):
+    def test_parse_file(self, parser, patch_file):
         """Test parsing from a file."""
-        diff_file = tmp_path / "test.patch"
-        diff_file.write_text(simple_diff)
-
-        result = parser.parse_file(str(diff_file))
+        result = parser.parse_file(str(patch_file))
 
         assert len(result) == 1
         assert result[0].file_path == "example.py"
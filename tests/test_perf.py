@@ -0,0 +1,72 @@
+"""
+Overhead budget for the review path outside the LLM call.
+"""
+
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ai_code_reviewer.analyzer import CodeReviewer
+
+OVERHEAD_BUDGET = 0.05
+RUNS = 5
+
+FIXTURE_CODE = '''
+import os
+
+
+def load_settings(path):
+    settings = {}
+    with open(path) as handle:
+        for line in handle:
+            key, _, value = line.partition("=")
+            settings[key.strip()] = value.strip()
+    return settings
+
+
+class Service:
+    def __init__(self, name, settings=None):
+        self.name = name
+        self.settings = settings or load_settings(os.environ["SETTINGS"])
+
+    def describe(self):
+        return f"{self.name}: {len(self.settings)} settings"
+'''
+
+RESPONSE = (
+    '```json\n{"issues": [{"type": "bug", "severity": "medium", "line": 16, '
+    '"message": "KeyError when SETTINGS is unset"}], "positive_feedback": ["Readable"]}\n```'
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep response caches out of the user's home directory."""
+    monkeypatch.setenv("AI_REVIEW_CACHE_DIR", str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    """Provide an OpenAI key without touching the real environment."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+class TestReviewOverhead:
+    """Tests for time spent outside the LLM call."""
+
+    def test_review_overhead_bounded(self):
+        """Test review adds less than 50ms on top of the LLM call."""
+        reviewer = CodeReviewer(cache=False)
+
+        # The LLM answers instantly, so the measured time is all local overhead.
+        with patch.object(CodeReviewer, "_request_llm", return_value=RESPONSE):
+            timings = []
+            for _ in range(RUNS):
+                start = time.perf_counter()
+                result = reviewer.review(FIXTURE_CODE, language="python")
+                timings.append(time.perf_counter() - start)
+
+        assert len(result.issues) == 1
+        assert statistics.median(timings) < OVERHEAD_BUDGET
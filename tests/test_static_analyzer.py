@@ -0,0 +1,83 @@
+"""
+Tests for the static pre-pass analyzer.
+"""
+
+import pytest
+
+from ai_code_reviewer.models import IssueType, Severity
+from ai_code_reviewer.static_analyzer import FastAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    """Create a FastAnalyzer instance."""
+    return FastAnalyzer()
+
+
+class TestFastAnalyzer:
+    """Tests for FastAnalyzer."""
+
+    def test_clean_code(self, analyzer):
+        """Test clean code produces no issues."""
+        code = "def add(a, b):\n    return a + b\n"
+
+        assert analyzer.analyze(code) == []
+
+    def test_eval_call(self, analyzer):
+        """Test eval() is flagged as a security issue."""
+        issues = analyzer.analyze("def calc(expr):\n    return eval(expr)\n")
+
+        assert len(issues) == 1
+        assert issues[0].type == IssueType.SECURITY
+        assert issues[0].severity == Severity.HIGH
+        assert issues[0].line == 2
+        assert issues[0].rule_id == "eval-call"
+
+    def test_pickle_loads(self, analyzer):
+        """Test pickle.loads is flagged."""
+        issues = analyzer.analyze("import pickle\npickle.loads(data)\n")
+
+        assert [i.rule_id for i in issues] == ["pickle-load"]
+
+    def test_shell_true(self, analyzer):
+        """Test subprocess calls with shell=True are flagged."""
+        issues = analyzer.analyze("subprocess.run(cmd, shell=True)\nsubprocess.run(cmd, shell=False)\n")
+
+        assert [i.rule_id for i in issues] == ["shell-true"]
+
+    def test_sql_string_formatting(self, analyzer):
+        """Test formatted SQL passed to execute is flagged, parameters are not."""
+        code = """
+def get_user(cursor, name):
+    query = f"SELECT * FROM users WHERE name = '{name}'"
+    cursor.execute(query)
+    cursor.execute("SELECT * FROM users WHERE name = ?", (name,))
+"""
+        issues = analyzer.analyze(code)
+
+        assert len(issues) == 1
+        assert issues[0].severity == Severity.CRITICAL
+        assert issues[0].line == 4
+
+    def test_bare_except(self, analyzer):
+        """Test bare except clauses are flagged."""
+        code = "try:\n    pass\nexcept:\n    pass\ntry:\n    pass\nexcept ValueError:\n    pass\n"
+        issues = analyzer.analyze(code)
+
+        assert [(i.line, i.rule_id) for i in issues] == [(3, "bare-except")]
+
+    def test_mutable_default(self, analyzer):
+        """Test mutable default arguments are flagged."""
+        code = "def f(a=[], b=None, *, c={}):\n    pass\n"
+        issues = analyzer.analyze(code)
+
+        assert [i.rule_id for i in issues] == ["mutable-default", "mutable-default"]
+        assert all(i.type == IssueType.BUG for i in issues)
+
+    def test_non_python_skipped(self, analyzer):
+        """Test other languages are left to the LLM."""
+        assert analyzer.analyze("eval(x)", language="javascript") == []
+
+    def test_syntax_error(self, analyzer):
+        """Test unparsable code produces no issues."""
+        assert analyzer.analyze("def broken(:\n") == []